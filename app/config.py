@@ -24,6 +24,8 @@ class Config:
             "render_distance": 128,
             "ui_scale": 1.0,
             "cache_size_mb": 1024,
+            "layout": None,  # AUI perspective saved on exit
+            "chat_scrollback": 2000,  # Chat lines kept in the chat panel
         },
         "network": {
             "timeout": 30,
@@ -3,6 +3,8 @@ User model for KitelyView.
 Represents a user account in the OpenSimulator grid.
 """
 
+import functools
+
 class User:
     """Represents a user in the virtual world"""
     
@@ -37,12 +39,17 @@ class User:
             if len(name_parts) > 1:
                 self.last_name = name_parts[1]
     
-    def get_full_name(self):
-        """Get the user's full name"""
+    @functools.cached_property
+    def full_name(self):
+        """The user's full name, computed once per name change"""
         if self.first_name and self.last_name:
             return f"{self.first_name} {self.last_name}"
         return self.name
     
+    def get_full_name(self):
+        """Get the user's full name"""
+        return self.full_name
+    
     def get_display_name(self):
         """Get the user's display name, falling back to regular name if not set"""
         if self.display_name:
@@ -94,6 +101,8 @@ class User:
                 self.first_name = name_parts[0]
             if len(name_parts) > 1:
                 self.last_name = name_parts[1]
+            # Drop the cached full name so it is rebuilt from the new parts
+            self.__dict__.pop("full_name", None)
         
         if "display_name" in data:
             self.display_name = data["display_name"]
@@ -4,6 +4,7 @@ Handles network connections to OpenSimulator servers.
 """
 
 import logging
+import asyncio
 import json
 import time
 import uuid
@@ -61,8 +62,8 @@ class GridConnection:
         
         self.websocket_connection = None
         
-    def login(self, first_name, last_name, password, start_location="last"):
-        """Authenticate with the grid"""
+    def login(self, first_name, last_name, password, start_location="last", cancel_event=None):
+        """Authenticate with the grid, giving up early once cancel_event is set"""
         self.logger.info(f"Attempting login for {first_name} {last_name}")
         
         # In a real implementation, we would make actual login requests to the grid
@@ -80,7 +81,56 @@ class GridConnection:
         
         # Simulate network request
         time.sleep(0.5)
+        if self._login_cancelled(cancel_event):
+            return False, "Login cancelled"
         
+        success, user_data = self._simulated_login_response(first_name, last_name)
+        
+        if success:
+            self._apply_login(user_data, start_location)
+            self._connect_to_simulator()
+            
+            self.logger.info(f"Login successful. Session ID: {self.session_id}")
+            return True, user_data
+        else:
+            self.logger.error("Login failed")
+            return False, "Authentication failed"
+    
+    async def login_async(self, first_name, last_name, password, start_location="last",
+                          cancel_event=None):
+        """Authenticate with the grid without blocking the calling thread"""
+        self.logger.info(f"Attempting login for {first_name} {last_name}")
+        
+        # Simulate login process
+        grid_uri = self.config.get("grid", "login_uri")
+        self.logger.info(f"Connecting to grid: {grid_uri}")
+        
+        # Simulate network request
+        await asyncio.sleep(0.5)
+        if self._login_cancelled(cancel_event):
+            return False, "Login cancelled"
+        
+        success, user_data = self._simulated_login_response(first_name, last_name)
+        
+        if success:
+            self._apply_login(user_data, start_location)
+            await self._connect_to_simulator_async()
+            
+            self.logger.info(f"Login successful. Session ID: {self.session_id}")
+            return True, user_data
+        else:
+            self.logger.error("Login failed")
+            return False, "Authentication failed"
+    
+    def _login_cancelled(self, cancel_event):
+        """Check whether the caller has asked to abandon the login"""
+        if cancel_event is not None and cancel_event.is_set():
+            self.logger.info("Login cancelled")
+            return True
+        return False
+    
+    def _simulated_login_response(self, first_name, last_name):
+        """Build the simulated login server response"""
         # For demo purposes, create simulated response
         # In a real client, this would be the response from the login server
         success = True
@@ -103,30 +153,25 @@ class GridConnection:
                 {"id": str(uuid.uuid4()), "name": "Builders Guild", "title": "Builder"}
             ]
         }
-        
-        if success:
-            self.logged_in = True
-            self.session_id = user_data["session_id"]
-            self.secure_session_id = user_data["secure_session_id"]
-            self.circuit_code = user_data["circuit_code"]
-            self.inventory_root = user_data["inventory_root"]
-            self.user_data = user_data
-            
-            # Set up current region from last location or home location
-            location = start_location
-            if start_location.lower() == "last":
-                location = user_data["last_location"]
-            elif start_location.lower() == "home":
-                location = user_data["home_location"]
-                
-            self._parse_location(location)
-            self._connect_to_simulator()
+        return success, user_data
+    
+    def _apply_login(self, user_data, start_location):
+        """Store session state from a successful login response"""
+        self.logged_in = True
+        self.session_id = user_data["session_id"]
+        self.secure_session_id = user_data["secure_session_id"]
+        self.circuit_code = user_data["circuit_code"]
+        self.inventory_root = user_data["inventory_root"]
+        self.user_data = user_data
+        
+        # Set up current region from last location or home location
+        location = start_location
+        if start_location.lower() == "last":
+            location = user_data["last_location"]
+        elif start_location.lower() == "home":
+            location = user_data["home_location"]
             
-            self.logger.info(f"Login successful. Session ID: {self.session_id}")
-            return True, user_data
-        else:
-            self.logger.error("Login failed")
-            return False, "Authentication failed"
+        self._parse_location(location)
     
     def disconnect(self):
         """Close connection to the grid"""
@@ -258,6 +303,26 @@ class GridConnection:
         # Simulate connection setup
         time.sleep(0.5)
         
+        return self._finish_simulator_connection()
+    
+    async def _connect_to_simulator_async(self):
+        """Connect to the current region simulator without blocking"""
+        if not self.logged_in:
+            self.logger.error("Cannot connect to simulator: Not logged in")
+            return False
+        
+        region_name = self.current_region["name"]
+        self.logger.info(f"Connecting to simulator for region: {region_name}")
+        
+        # Simulate connection setup
+        await asyncio.sleep(0.5)
+        
+        return self._finish_simulator_connection()
+    
+    def _finish_simulator_connection(self):
+        """Record simulator details once the connection is set up"""
+        region_name = self.current_region["name"]
+        
         # Simulate setting up region information from grid response
         self.current_region["ip"] = "simulator.kitely.com"
         self.current_region["port"] = 8002
@@ -4,9 +4,126 @@ Displays and manages the user's inventory items.
 """
 
 import wx
+import wx.dataview
 import logging
+import os
+import threading
 import time
 
+# Art provider bitmaps shared by all inventory panels
+_ART_CACHE = {}
+
+def _art(art_id):
+    """Get a 16x16 art provider bitmap, looking it up only once"""
+    bitmap = _ART_CACHE.get(art_id)
+    if bitmap is None:
+        bitmap = wx.ArtProvider.GetBitmap(art_id, wx.ART_OTHER, (16, 16))
+        _ART_CACHE[art_id] = bitmap
+    return bitmap
+
+class InvItem:
+    """Compact inventory entry shown in the inventory tree"""
+    
+    __slots__ = ("name", "type", "parent_id", "name_lower", "creator", "created")
+    
+    def __init__(self, name, item_type, parent_id=None, creator=None, created=None):
+        """Initialize the inventory entry"""
+        self.name = name
+        self.type = item_type
+        self.parent_id = parent_id
+        self.name_lower = name.lower()
+        self.creator = creator
+        self.created = created
+
+# Stands in for the single "Loading..." / "Not logged in" row
+_PLACEHOLDER = object()
+
+class InventoryModel(wx.dataview.PyDataViewModel):
+    """Data view model that serves inventory rows on demand"""
+    
+    def __init__(self, panel):
+        """Initialize the inventory model"""
+        wx.dataview.PyDataViewModel.__init__(self)
+        
+        # The panel owns the inventory data and indexes
+        self.panel = panel
+        
+        # Text of the placeholder row, or None to show the inventory
+        self.placeholder = None
+        
+        # IDs shown while a filter is active, or None when unfiltered
+        self.visible = None
+        
+    def GetColumnCount(self):
+        """Get the number of columns"""
+        return 1
+        
+    def GetColumnType(self, col):
+        """Get the value type of a column"""
+        return "wxDataViewIconText"
+        
+    def IsContainer(self, item):
+        """Check whether an item can have children"""
+        # The invisible root holds the top-level entries
+        if not item:
+            return True
+            
+        entry = self.panel.inventory_items.get(self.ItemToObject(item))
+        return entry is not None and entry.type == "folder"
+        
+    def GetParent(self, item):
+        """Get the parent of an item"""
+        if not item:
+            return wx.dataview.NullDataViewItem
+            
+        entry = self.panel.inventory_items.get(self.ItemToObject(item))
+        if entry is None or entry.parent_id == self.panel.inventory_root:
+            return wx.dataview.NullDataViewItem
+            
+        return self.ObjectToItem(entry.parent_id)
+        
+    def GetChildren(self, parent, children):
+        """Fill children with the child items of parent"""
+        if not parent:
+            if self.placeholder is not None:
+                children.append(self.ObjectToItem(_PLACEHOLDER))
+                return 1
+            parent_id = self.panel.inventory_root
+        else:
+            parent_id = self.ItemToObject(parent)
+            
+        visible = self.visible
+        for child_id in self.panel._children_index.get(parent_id, ()):
+            if visible is None or child_id in visible:
+                children.append(self.ObjectToItem(child_id))
+                
+        return len(children)
+        
+    def GetValue(self, item, col):
+        """Get the displayed name and icon of an item"""
+        item_id = self.ItemToObject(item)
+        if item_id is _PLACEHOLDER:
+            return wx.dataview.DataViewIconText(self.placeholder)
+            
+        entry = self.panel.inventory_items[item_id]
+        return wx.dataview.DataViewIconText(
+            entry.name,
+            self.panel.get_icon_for_type(entry.type)
+        )
+        
+    def SetValue(self, value, item, col):
+        """Store an edited name"""
+        item_id = self.ItemToObject(item)
+        entry = self.panel.inventory_items.get(item_id)
+        if entry is None:
+            return False
+            
+        # In a real app, this would rename on the server
+        entry.name = value.GetText()
+        entry.name_lower = entry.name.lower()
+        self.panel._build_indexes()
+        return True
+
 class InventoryPanel(wx.Panel):
     """Panel for managing user inventory"""
     
@@ -25,13 +142,28 @@ class InventoryPanel(wx.Panel):
         self.inventory_root = None
         self.inventory_items = {}
         
+        # Lookup indexes (built once per load), columns share positions
+        self._ids = []
+        self._types = []
+        self._parents = []
+        self._parent_idx = []
+        self._names_lower = []
+        self._id_to_idx = {}
+        self._children_index = {}
+        self._trigram_index = {}
+        
         # UI setup
         self._create_ui()
         
         # Bind events
         self.filter_text.Bind(wx.EVT_TEXT, self.on_filter_changed)
-        self.inventory_tree.Bind(wx.EVT_TREE_ITEM_ACTIVATED, self.on_item_activated)
-        self.inventory_tree.Bind(wx.EVT_TREE_ITEM_RIGHT_CLICK, self.on_item_right_click)
+        self.inventory_tree.Bind(wx.dataview.EVT_DATAVIEW_ITEM_ACTIVATED, self.on_item_activated)
+        self.inventory_tree.Bind(wx.dataview.EVT_DATAVIEW_ITEM_CONTEXT_MENU, self.on_item_right_click)
+        
+        # Context menu commands act on the focused tree item
+        self.Bind(wx.EVT_MENU, self._on_menu_properties, id=wx.ID_PROPERTIES)
+        self.Bind(wx.EVT_MENU, self._on_menu_rename, id=wx.ID_RENAME)
+        self.Bind(wx.EVT_MENU, self._on_menu_delete, id=wx.ID_DELETE)
         
         self.logger.info("Inventory panel initialized")
         
@@ -56,39 +188,34 @@ class InventoryPanel(wx.Panel):
         
         main_sizer.Add(toolbar_sizer, 0, wx.EXPAND)
         
-        # Create inventory tree control
-        self.inventory_tree = wx.TreeCtrl(
+        # Create inventory tree control, rows are requested from the model
+        self.inventory_tree = wx.dataview.DataViewCtrl(
             self,
-            style=wx.TR_DEFAULT_STYLE | wx.TR_HIDE_ROOT | wx.TR_MULTIPLE | wx.TR_EDIT_LABELS
+            style=wx.dataview.DV_NO_HEADER | wx.dataview.DV_MULTIPLE
         )
-        
-        # Create image list for tree icons
-        self.image_list = wx.ImageList(16, 16)
-        # Create icons from built-in art provider
-        self.folder_icon = self.image_list.Add(
-            wx.ArtProvider.GetBitmap(wx.ART_FOLDER, wx.ART_OTHER, (16, 16))
-        )
-        self.file_icon = self.image_list.Add(
-            wx.ArtProvider.GetBitmap(wx.ART_NORMAL_FILE, wx.ART_OTHER, (16, 16))
-        )
-        self.clothing_icon = self.image_list.Add(
-            wx.ArtProvider.GetBitmap(wx.ART_HELP_SIDE_PANEL, wx.ART_OTHER, (16, 16))
-        )
-        self.object_icon = self.image_list.Add(
-            wx.ArtProvider.GetBitmap(wx.ART_REPORT_VIEW, wx.ART_OTHER, (16, 16))
-        )
-        self.texture_icon = self.image_list.Add(
-            wx.ArtProvider.GetBitmap(wx.ART_MISSING_IMAGE, wx.ART_OTHER, (16, 16))
-        )
-        self.script_icon = self.image_list.Add(
-            wx.ArtProvider.GetBitmap(wx.ART_EXECUTABLE_FILE, wx.ART_OTHER, (16, 16))
+        self.inventory_model = InventoryModel(self)
+        self.inventory_tree.AssociateModel(self.inventory_model)
+        self.inventory_tree.AppendIconTextColumn(
+            "Name", 0,
+            mode=wx.dataview.DATAVIEW_CELL_EDITABLE
         )
         
-        # Set image list
-        self.inventory_tree.SetImageList(self.image_list)
-        
-        # Add invisible root
-        self.inventory_tree.AddRoot("Inventory")
+        # Create icons from built-in art provider
+        self.folder_icon = self._make_icon(wx.ART_FOLDER)
+        self.file_icon = self._make_icon(wx.ART_NORMAL_FILE)
+        self.clothing_icon = self._make_icon(wx.ART_HELP_SIDE_PANEL)
+        self.object_icon = self._make_icon(wx.ART_REPORT_VIEW)
+        self.texture_icon = self._make_icon(wx.ART_MISSING_IMAGE)
+        self.script_icon = self._make_icon(wx.ART_EXECUTABLE_FILE)
+        
+        # Map item types to icons
+        self._icon_map = {
+            "folder": self.folder_icon,
+            "clothing": self.clothing_icon,
+            "object": self.object_icon,
+            "texture": self.texture_icon,
+            "script": self.script_icon
+        }
         
         main_sizer.Add(self.inventory_tree, 1, wx.EXPAND | wx.ALL, 5)
         
@@ -100,6 +227,12 @@ class InventoryPanel(wx.Panel):
         # Set sizer
         self.SetSizer(main_sizer)
         
+    def _make_icon(self, art_id):
+        """Create a tree icon from an art provider bitmap"""
+        icon = wx.Icon()
+        icon.CopyFromBitmap(_art(art_id))
+        return icon
+        
     def on_filter_changed(self, event):
         """Handle filter text changes"""
         # Get filter text
@@ -115,123 +248,111 @@ class InventoryPanel(wx.Panel):
         
     def apply_filter(self, filter_text):
         """Filter inventory items by name"""
-        # Clear tree
-        self.inventory_tree.DeleteAllItems()
-        root = self.inventory_tree.AddRoot("Inventory")
-        
         # If no inventory loaded yet, return
         if not self.inventory_root:
             return
             
-        # Create filtered categories
-        filtered_items = {}
-        
-        # Add matching items to filtered tree
-        for item_id, item in self.inventory_items.items():
-            if filter_text in item["name"].lower():
-                # Get or create parent folder
-                parent_id = item.get("parent_id")
+        # Show the matches along with the folders leading to them
+        visible = set()
+        ids = self._ids
+        parent_idx = self._parent_idx
+        for i in self._find_matches(filter_text):
+            while i >= 0 and ids[i] not in visible:
+                visible.add(ids[i])
+                i = parent_idx[i]
+                
+        # Batch redraws while the model is reset
+        self.inventory_tree.Freeze()
+        try:
+            self.inventory_model.placeholder = None
+            self.inventory_model.visible = visible
+            self.inventory_model.Cleared()
+            
+            # Expand all folders for easier viewing of filtered results
+            self._expand_folders(self.inventory_root, visible, recursive=True)
+        finally:
+            self.inventory_tree.Thaw()
+        
+    def _expand_folders(self, parent_id, visible=None, recursive=False):
+        """Expand the child folders of parent_id, parents before children"""
+        for child_id in self._children_index.get(parent_id, ()):
+            if visible is not None and child_id not in visible:
+                continue
+            if self.inventory_items[child_id].type != "folder":
+                continue
                 
-                if parent_id not in filtered_items:
-                    # Create parent folder if needed
-                    if parent_id in self.inventory_items:
-                        parent_item = self.inventory_items[parent_id]
-                        parent_node = self.inventory_tree.AppendItem(
-                            root,
-                            parent_item["name"],
-                            self.folder_icon
-                        )
-                        filtered_items[parent_id] = parent_node
-                    else:
-                        # If parent not found, add under root
-                        parent_node = root
-                else:
-                    parent_node = filtered_items[parent_id]
+            self.inventory_tree.Expand(self.inventory_model.ObjectToItem(child_id))
+            if recursive:
+                self._expand_folders(child_id, visible, recursive)
                 
-                # Add item to tree
-                icon = self.get_icon_for_type(item["type"])
-                tree_item = self.inventory_tree.AppendItem(
-                    parent_node,
-                    item["name"],
-                    icon
-                )
-                self.inventory_tree.SetItemData(tree_item, item_id)
-        
-        # Expand all items for easier viewing of filtered results
-        self.inventory_tree.ExpandAll()
+    def _build_indexes(self):
+        """Build the column, child and trigram indexes over the loaded inventory"""
+        items = self.inventory_items.values()
+        self._ids = list(self.inventory_items)
+        self._types = [item.type for item in items]
+        self._parents = [item.parent_id for item in items]
+        self._names_lower = [item.name_lower for item in items]
+        self._id_to_idx = {item_id: i for i, item_id in enumerate(self._ids)}
+        self._parent_idx = [self._id_to_idx.get(parent_id, -1) for parent_id in self._parents]
+        self._children_index = {}
+        self._trigram_index = {}
+        
+        # Map each 3-character substring to the positions containing it
+        for i, name_lower in enumerate(self._names_lower):
+            for j in range(len(name_lower) - 2):
+                self._trigram_index.setdefault(name_lower[j:j + 3], set()).add(i)
+                
+        # List folders ahead of items within each parent
+        for item_id, item_type, parent_id in zip(self._ids, self._types, self._parents):
+            if item_type == "folder":
+                self._children_index.setdefault(parent_id, []).append(item_id)
+        for item_id, item_type, parent_id in zip(self._ids, self._types, self._parents):
+            if item_type != "folder":
+                self._children_index.setdefault(parent_id, []).append(item_id)
+                
+    def _find_matches(self, filter_text):
+        """Get positions of items whose name contains filter_text, in inventory order"""
+        names_lower = self._names_lower
+        
+        # Short queries have no trigrams, fall back to a linear scan
+        if len(filter_text) < 3:
+            return [i for i, name_lower in enumerate(names_lower) if filter_text in name_lower]
+            
+        # Intersect the candidate sets, smallest first
+        candidate_sets = []
+        for j in range(len(filter_text) - 2):
+            positions = self._trigram_index.get(filter_text[j:j + 3])
+            if not positions:
+                return []
+            candidate_sets.append(positions)
+        candidate_sets.sort(key=len)
+        candidates = set.intersection(*candidate_sets)
+        
+        # Trigram hits may be out of sequence, so verify the full substring
+        return sorted(i for i in candidates if filter_text in names_lower[i])
         
     def get_icon_for_type(self, item_type):
         """Get the appropriate icon for the item type"""
-        if item_type == "folder":
-            return self.folder_icon
-        elif item_type == "clothing":
-            return self.clothing_icon
-        elif item_type == "object":
-            return self.object_icon
-        elif item_type == "texture":
-            return self.texture_icon
-        elif item_type == "script":
-            return self.script_icon
-        else:
-            return self.file_icon
+        return self._icon_map.get(item_type, self.file_icon)
         
     def populate_inventory(self):
         """Populate the inventory tree with user's items"""
-        # Clear tree
-        self.inventory_tree.DeleteAllItems()
-        root = self.inventory_tree.AddRoot("Inventory")
-        
-        # If no inventory loaded yet, return
-        if not self.inventory_root:
-            self.inventory_tree.AppendItem(root, "Loading inventory...")
-            return
+        # Batch redraws while the model is reset
+        self.inventory_tree.Freeze()
+        try:
+            # If no inventory loaded yet, show a placeholder row
+            if not self.inventory_root:
+                self.inventory_model.placeholder = "Loading inventory..."
+            else:
+                self.inventory_model.placeholder = None
+            self.inventory_model.visible = None
+            self.inventory_model.Cleared()
             
-        # Track tree items by ID for quick access
-        tree_items = {}
-        tree_items[self.inventory_root] = root
-        
-        # First pass: create all folders
-        for item_id, item in self.inventory_items.items():
-            if item["type"] == "folder":
-                parent_id = item.get("parent_id", self.inventory_root)
-                
-                # Skip if parent not found (shouldn't happen in well-formed inventory)
-                if parent_id not in tree_items:
-                    if parent_id != self.inventory_root:
-                        continue
-                        
-                # Create folder
-                tree_item = self.inventory_tree.AppendItem(
-                    tree_items[parent_id],
-                    item["name"],
-                    self.folder_icon
-                )
-                self.inventory_tree.SetItemData(tree_item, item_id)
-                tree_items[item_id] = tree_item
-                
-        # Second pass: add all items
-        for item_id, item in self.inventory_items.items():
-            if item["type"] != "folder":
-                parent_id = item.get("parent_id", self.inventory_root)
-                
-                # Skip if parent not found
-                if parent_id not in tree_items:
-                    continue
-                    
-                # Create item
-                icon = self.get_icon_for_type(item["type"])
-                tree_item = self.inventory_tree.AppendItem(
-                    tree_items[parent_id],
-                    item["name"],
-                    icon
-                )
-                self.inventory_tree.SetItemData(tree_item, item_id)
-                
-        # Expand root category folders
-        child, cookie = self.inventory_tree.GetFirstChild(root)
-        while child.IsOk():
-            self.inventory_tree.Expand(child)
-            child, cookie = self.inventory_tree.GetNextChild(root, cookie)
+            # Expand root category folders
+            if self.inventory_root:
+                self._expand_folders(self.inventory_root)
+        finally:
+            self.inventory_tree.Thaw()
         
     def load_inventory(self):
         """Load inventory from the grid"""
@@ -239,12 +360,32 @@ class InventoryPanel(wx.Panel):
         self.progress.Show()
         self.progress.SetValue(0)
         
-        # Clear existing inventory
-        self.inventory_items = {}
-        
-        # In a real application, this would fetch from the server
-        # For now, create a sample inventory structure
-        self.create_sample_inventory()
+        # Fetch in the background so the UI stays responsive
+        threading.Thread(
+            target=self._load_inventory_worker,
+            daemon=True
+        ).start()
+        
+    def _load_inventory_worker(self):
+        """Thread for fetching the inventory"""
+        try:
+            # In a real application, this would fetch from the server
+            # For now, create a sample inventory structure
+            items, root = self.create_sample_inventory()
+            
+            # Hand the results back to the UI thread
+            wx.CallAfter(self._on_inventory_loaded, items, root)
+            
+        except Exception as e:
+            self.logger.error(f"Inventory load error: {e}", exc_info=True)
+            wx.CallAfter(self.progress.Hide)
+            
+    def _on_inventory_loaded(self, items, root):
+        """Apply a freshly loaded inventory (UI thread)"""
+        # Store inventory data
+        self.inventory_items = items
+        self.inventory_root = root
+        self._build_indexes()
         
         # Populate the inventory tree
         self.populate_inventory()
@@ -253,125 +394,59 @@ class InventoryPanel(wx.Panel):
         self.progress.Hide()
         
     def create_sample_inventory(self):
-        """Create a sample inventory for testing"""
+        """Create a sample inventory for testing
+        
+        Returns:
+            tuple: (items dict keyed by item ID, root item ID)
+        """
         # This would normally come from the server
         
         # Create root
-        self.inventory_root = "inventory_root"
+        inventory_root = "inventory_root"
         
         # Create basic structure
-        self.inventory_items = {
-            "inventory_root": {
-                "name": "My Inventory",
-                "type": "folder",
-                "parent_id": None
-            },
-            "folder_1": {
-                "name": "Clothing",
-                "type": "folder",
-                "parent_id": "inventory_root"
-            },
-            "folder_2": {
-                "name": "Objects",
-                "type": "folder",
-                "parent_id": "inventory_root"
-            },
-            "folder_3": {
-                "name": "Textures",
-                "type": "folder",
-                "parent_id": "inventory_root"
-            },
-            "folder_4": {
-                "name": "Scripts",
-                "type": "folder",
-                "parent_id": "inventory_root"
-            },
-            "folder_5": {
-                "name": "Notecards",
-                "type": "folder",
-                "parent_id": "inventory_root"
-            },
-            "folder_6": {
-                "name": "Body Parts",
-                "type": "folder",
-                "parent_id": "inventory_root"
-            },
-            "folder_7": {
-                "name": "Animations",
-                "type": "folder",
-                "parent_id": "inventory_root"
-            },
-            "folder_8": {
-                "name": "Landmarks",
-                "type": "folder",
-                "parent_id": "inventory_root"
-            },
-            "folder_9": {
-                "name": "Shirts",
-                "type": "folder",
-                "parent_id": "folder_1"
-            },
-            "folder_10": {
-                "name": "Pants",
-                "type": "folder",
-                "parent_id": "folder_1"
-            },
-            "item_1": {
-                "name": "Blue Shirt",
-                "type": "clothing",
-                "parent_id": "folder_9"
-            },
-            "item_2": {
-                "name": "Red Shirt",
-                "type": "clothing",
-                "parent_id": "folder_9"
-            },
-            "item_3": {
-                "name": "Black Pants",
-                "type": "clothing",
-                "parent_id": "folder_10"
-            },
-            "item_4": {
-                "name": "Wooden Chair",
-                "type": "object",
-                "parent_id": "folder_2"
-            },
-            "item_5": {
-                "name": "Table",
-                "type": "object",
-                "parent_id": "folder_2"
-            },
-            "item_6": {
-                "name": "Brick Texture",
-                "type": "texture",
-                "parent_id": "folder_3"
-            },
-            "item_7": {
-                "name": "Door Script",
-                "type": "script",
-                "parent_id": "folder_4"
-            }
+        inventory_items = {
+            "inventory_root": InvItem("My Inventory", "folder", None),
+            "folder_1": InvItem("Clothing", "folder", "inventory_root"),
+            "folder_2": InvItem("Objects", "folder", "inventory_root"),
+            "folder_3": InvItem("Textures", "folder", "inventory_root"),
+            "folder_4": InvItem("Scripts", "folder", "inventory_root"),
+            "folder_5": InvItem("Notecards", "folder", "inventory_root"),
+            "folder_6": InvItem("Body Parts", "folder", "inventory_root"),
+            "folder_7": InvItem("Animations", "folder", "inventory_root"),
+            "folder_8": InvItem("Landmarks", "folder", "inventory_root"),
+            "folder_9": InvItem("Shirts", "folder", "folder_1"),
+            "folder_10": InvItem("Pants", "folder", "folder_1"),
+            "item_1": InvItem("Blue Shirt", "clothing", "folder_9"),
+            "item_2": InvItem("Red Shirt", "clothing", "folder_9"),
+            "item_3": InvItem("Black Pants", "clothing", "folder_10"),
+            "item_4": InvItem("Wooden Chair", "object", "folder_2"),
+            "item_5": InvItem("Table", "object", "folder_2"),
+            "item_6": InvItem("Brick Texture", "texture", "folder_3"),
+            "item_7": InvItem("Door Script", "script", "folder_4")
         }
         
-        # Simulate loading time
-        time.sleep(0.5)
+        # Optional artificial latency for development
+        fake_latency = os.environ.get("KV_FAKE_LATENCY")
+        if fake_latency:
+            time.sleep(float(fake_latency))
+        
+        return inventory_items, inventory_root
         
     def on_item_activated(self, event):
         """Handle item double-click"""
         # Get selected item
-        item_id = self.inventory_tree.GetItemData(event.GetItem())
-        
-        # If no data, return
-        if not item_id:
+        if not event.GetItem():
             return
-            
+        item_id = self.inventory_model.ItemToObject(event.GetItem())
+        
         # Get item details
         item = self.inventory_items.get(item_id)
         if not item:
             return
             
         # Handle different item types
-        if item["type"] == "folder":
+        if item.type == "folder":
             # Toggle expansion
             if self.inventory_tree.IsExpanded(event.GetItem()):
                 self.inventory_tree.Collapse(event.GetItem())
@@ -384,12 +459,10 @@ class InventoryPanel(wx.Panel):
     def on_item_right_click(self, event):
         """Handle item right-click"""
         # Get selected item
-        item_id = self.inventory_tree.GetItemData(event.GetItem())
-        
-        # If no data, return
-        if not item_id:
+        if not event.GetItem():
             return
-            
+        item_id = self.inventory_model.ItemToObject(event.GetItem())
+        
         # Get item details
         item = self.inventory_items.get(item_id)
         if not item:
@@ -404,31 +477,59 @@ class InventoryPanel(wx.Panel):
         menu.Append(wx.ID_DELETE, "Delete")
         
         # Add type-specific options
-        if item["type"] == "folder":
+        if item.type == "folder":
             menu.AppendSeparator()
             menu.Append(wx.ID_NEW, "New Folder")
-        elif item["type"] == "object":
+        elif item.type == "object":
             menu.AppendSeparator()
             menu.Append(wx.ID_ANY, "Rez")
             menu.Append(wx.ID_ANY, "Wear")
-        elif item["type"] == "clothing":
+        elif item.type == "clothing":
             menu.AppendSeparator()
             menu.Append(wx.ID_ANY, "Wear")
             menu.Append(wx.ID_ANY, "Take Off")
         
-        # Bind events
-        self.Bind(wx.EVT_MENU, lambda e: self.show_item_properties(item), id=wx.ID_PROPERTIES)
-        self.Bind(wx.EVT_MENU, lambda e: self.rename_item(event.GetItem()), id=wx.ID_RENAME)
-        self.Bind(wx.EVT_MENU, lambda e: self.delete_item(item_id), id=wx.ID_DELETE)
+        # Menu handlers read the target back from the current item
+        self.inventory_tree.SetCurrentItem(event.GetItem())
         
         # Show menu
         self.PopupMenu(menu)
         menu.Destroy()
         
+    def _get_focused_item(self):
+        """Get the current tree item and its inventory ID"""
+        tree_item = self.inventory_tree.GetCurrentItem()
+        if not tree_item:
+            return None, None
+            
+        item_id = self.inventory_model.ItemToObject(tree_item)
+        if item_id is _PLACEHOLDER or item_id not in self.inventory_items:
+            return None, None
+            
+        return tree_item, item_id
+        
+    def _on_menu_properties(self, event):
+        """Handle the Properties context menu command"""
+        tree_item, item_id = self._get_focused_item()
+        if item_id:
+            self.show_item_properties(self.inventory_items[item_id])
+            
+    def _on_menu_rename(self, event):
+        """Handle the Rename context menu command"""
+        tree_item, item_id = self._get_focused_item()
+        if item_id:
+            self.rename_item(tree_item)
+            
+    def _on_menu_delete(self, event):
+        """Handle the Delete context menu command"""
+        tree_item, item_id = self._get_focused_item()
+        if item_id:
+            self.delete_item(item_id)
+            
     def show_item_properties(self, item):
         """Show item properties dialog"""
         # Create dialog
-        dlg = wx.Dialog(self, title=f"Properties: {item['name']}", size=(350, 200))
+        dlg = wx.Dialog(self, title=f"Properties: {item.name}", size=(350, 200))
         
         # Create sizer
         sizer = wx.BoxSizer(wx.VERTICAL)
@@ -438,18 +539,18 @@ class InventoryPanel(wx.Panel):
         grid.AddGrowableCol(1)
         
         grid.Add(wx.StaticText(dlg, label="Name:"))
-        grid.Add(wx.StaticText(dlg, label=item["name"]), flag=wx.EXPAND)
+        grid.Add(wx.StaticText(dlg, label=item.name), flag=wx.EXPAND)
         
         grid.Add(wx.StaticText(dlg, label="Type:"))
-        grid.Add(wx.StaticText(dlg, label=item["type"].capitalize()), flag=wx.EXPAND)
+        grid.Add(wx.StaticText(dlg, label=item.type.capitalize()), flag=wx.EXPAND)
         
-        if "creator" in item:
+        if item.creator is not None:
             grid.Add(wx.StaticText(dlg, label="Creator:"))
-            grid.Add(wx.StaticText(dlg, label=item["creator"]), flag=wx.EXPAND)
+            grid.Add(wx.StaticText(dlg, label=item.creator), flag=wx.EXPAND)
             
-        if "created" in item:
+        if item.created is not None:
             grid.Add(wx.StaticText(dlg, label="Created:"))
-            grid.Add(wx.StaticText(dlg, label=item["created"]), flag=wx.EXPAND)
+            grid.Add(wx.StaticText(dlg, label=item.created), flag=wx.EXPAND)
             
         sizer.Add(grid, 0, wx.ALL | wx.EXPAND, 10)
         
@@ -466,14 +567,14 @@ class InventoryPanel(wx.Panel):
     def rename_item(self, tree_item):
         """Rename the selected item"""
         # Begin editing label
-        self.inventory_tree.EditLabel(tree_item)
+        self.inventory_tree.EditItem(tree_item, self.inventory_tree.GetColumn(0))
         
     def delete_item(self, item_id):
         """Delete the selected item"""
         # Confirm deletion
         dlg = wx.MessageDialog(
             self,
-            f"Are you sure you want to delete '{self.inventory_items[item_id]['name']}'?",
+            f"Are you sure you want to delete '{self.inventory_items[item_id].name}'?",
             "Confirm Delete",
             wx.YES_NO | wx.ICON_QUESTION
         )
@@ -484,6 +585,7 @@ class InventoryPanel(wx.Panel):
             # In a real app, this would delete on the server
             # For now, just remove from local inventory
             del self.inventory_items[item_id]
+            self._build_indexes()
             self.populate_inventory()
             
     def on_refresh(self, event):
@@ -501,6 +603,11 @@ class InventoryPanel(wx.Panel):
         # Clear inventory
         self.inventory_items = {}
         self.inventory_root = None
-        self.inventory_tree.DeleteAllItems()
-        root = self.inventory_tree.AddRoot("Inventory")
-        self.inventory_tree.AppendItem(root, "Not logged in")
+        self._build_indexes()
+        self.inventory_tree.Freeze()
+        try:
+            self.inventory_model.placeholder = "Not logged in"
+            self.inventory_model.visible = None
+            self.inventory_model.Cleared()
+        finally:
+            self.inventory_tree.Thaw()
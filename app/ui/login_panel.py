@@ -5,11 +5,17 @@ Handles user authentication to the Kitely grid.
 
 import wx
 import wx.html
+import asyncio
 import threading
 import logging
 import io
+import re
 from PIL import Image
 from app.network.connection import GridConnection
+from app.utils.helpers import get_async_loop
+
+# "First Last" or "First.Last"
+_NAME_RE = re.compile(r"^\s*([^\s.]+)[\s.]+(.+?)\s*$")
 
 class LoginPanel(wx.Panel):
     """Panel for handling login to the Kitely grid"""
@@ -28,6 +34,10 @@ class LoginPanel(wx.Panel):
         # Create grid connection
         self.connection = GridConnection(self.main_window.config)
         
+        # In-flight login and its cancel signal
+        self._login_cancel = threading.Event()
+        self._login_future = None
+        
         # Set up panel style and layout
         self.SetBackgroundColour(wx.Colour(240, 240, 240))
         
@@ -38,6 +48,7 @@ class LoginPanel(wx.Panel):
         self.login_button.Bind(wx.EVT_BUTTON, self.on_login)
         self.cancel_button.Bind(wx.EVT_BUTTON, self.on_cancel)
         self.grid_choice.Bind(wx.EVT_CHOICE, self.on_grid_change)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self._on_destroy)
         
         # Load grid info
         self._load_grid_info()
@@ -169,20 +180,12 @@ class LoginPanel(wx.Panel):
             self.show_error("Please enter a password")
             return
             
-        # Parse username into first/last name if needed
-        user_parts = username.split(' ')
-        if len(user_parts) == 1:
-            # Assume the format is first.last
-            name_parts = username.split('.')
-            if len(name_parts) == 2:
-                first_name = name_parts[0]
-                last_name = name_parts[1]
-            else:
-                self.show_error("Invalid username format. Use 'First Last' or 'First.Last'")
-                return
-        else:
-            first_name = user_parts[0]
-            last_name = ' '.join(user_parts[1:])
+        # Parse username into first/last name
+        match = _NAME_RE.match(username)
+        if not match:
+            self.show_error("Invalid username format. Use 'First Last' or 'First.Last'")
+            return
+        first_name, last_name = match.group(1), match.group(2)
             
         # Show progress indicator
         self.progress.Show()
@@ -191,45 +194,60 @@ class LoginPanel(wx.Panel):
         self.cancel_button.Disable()
         self.status_text.SetLabel("Connecting to grid...")
         
-        # Use a thread for login to avoid freezing the UI
-        threading.Thread(
-            target=self._login_thread,
-            args=(first_name, last_name, password, location),
-            daemon=True
-        ).start()
+        # Run the login on the background event loop to avoid freezing the UI
+        self._login_cancel.clear()
+        self._login_future = asyncio.run_coroutine_threadsafe(
+            self._login_task(first_name, last_name, password, location),
+            get_async_loop()
+        )
         
-    def _login_thread(self, first_name, last_name, password, location):
-        """Thread for handling login process"""
+    async def _login_task(self, first_name, last_name, password, location):
+        """Coroutine for handling login process"""
         try:
             # Update progress
-            wx.CallAfter(self.progress.SetValue, 30)
-            wx.CallAfter(self.status_text.SetLabel, "Authenticating...")
+            wx.CallAfter(self._apply_phase, 30, "Authenticating...")
             
             # Attempt login
-            success, result = self.connection.login(first_name, last_name, password, location)
+            success, result = await self.connection.login_async(
+                first_name, last_name, password, location,
+                cancel_event=self._login_cancel
+            )
             
             if success:
-                # Update progress
-                wx.CallAfter(self.progress.SetValue, 70)
-                wx.CallAfter(self.status_text.SetLabel, "Loading world...")
-                
-                # Handle successful login
-                wx.CallAfter(self._login_success, result)
+                # Update progress, then handle successful login
+                wx.CallAfter(self._apply_phase, 70, "Loading world...", result)
             else:
                 # Handle login failure
-                wx.CallAfter(self.show_error, f"Login failed: {result}")
-                wx.CallAfter(self.progress.Hide)
-                wx.CallAfter(self.login_button.Enable)
-                wx.CallAfter(self.cancel_button.Enable)
+                wx.CallAfter(self._login_failed, f"Login failed: {result}")
                 
         except Exception as e:
             # Handle unexpected errors
-            wx.CallAfter(self.show_error, f"Error during login: {str(e)}")
-            wx.CallAfter(self.progress.Hide)
-            wx.CallAfter(self.login_button.Enable)
-            wx.CallAfter(self.cancel_button.Enable)
+            wx.CallAfter(self._login_failed, f"Error during login: {str(e)}")
             self.logger.error(f"Login error: {e}", exc_info=True)
     
+    def _apply_phase(self, progress_value, status, user_data=None):
+        """Update login progress and status together (UI thread)"""
+        # The panel may have been destroyed while the login was running
+        if not self or self.IsBeingDeleted():
+            return
+            
+        self.progress.SetValue(progress_value)
+        self.status_text.SetLabel(status)
+        
+        # The final phase carries the login result
+        if user_data is not None:
+            self._login_success(user_data)
+    
+    def _login_failed(self, message):
+        """Show a login error and reset the UI (UI thread)"""
+        if not self or self.IsBeingDeleted():
+            return
+            
+        self.show_error(message)
+        self.progress.Hide()
+        self.login_button.Enable()
+        self.cancel_button.Enable()
+    
     def _login_success(self, user_data):
         """Handle successful login"""
         # Update progress
@@ -262,11 +280,24 @@ class LoginPanel(wx.Panel):
         
         # If login is in progress, cancel it
         if not self.login_button.IsEnabled():
-            # TODO: Implement cancel logic for the connection
+            self._cancel_login()
             self.login_button.Enable()
             self.cancel_button.Enable()
             self.progress.Hide()
     
+    def _cancel_login(self):
+        """Signal the in-flight login, if any, to stop"""
+        self._login_cancel.set()
+        if self._login_future is not None:
+            self._login_future.cancel()
+            self._login_future = None
+    
+    def _on_destroy(self, event):
+        """Stop any in-flight login when the panel is destroyed"""
+        if event.GetEventObject() is self:
+            self._cancel_login()
+        event.Skip()
+    
     def show_error(self, message):
         """Display an error message"""
         self.status_text.SetLabel(message)
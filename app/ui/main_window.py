@@ -134,12 +134,15 @@ class MainWindow(wx.Frame):
         self.toolbar = ViewerToolbar(self)
         self.SetToolBar(self.toolbar)
         
-        # Create panels
+        # Create panels, session panels are created on first login
         self.world_view = WorldViewPanel(self)
         self.login_panel = LoginPanel(self)
-        self.chat_panel = ChatPanel(self)
-        self.inventory_panel = InventoryPanel(self)
-        self.mini_map = MiniMapPanel(self)
+        self.chat_panel = None
+        self.inventory_panel = None
+        self.mini_map = None
+        
+        # Default pane layouts for panes added after startup
+        self._default_pane_info = {}
         
         # Add panels to AUI manager
         self.aui_manager.AddPane(
@@ -154,6 +157,31 @@ class MainWindow(wx.Frame):
             Dockable(False).Show(not self.is_logged_in)
         )
         
+        # Remember the default layout for on_reset_layout
+        self._default_perspective = self.aui_manager.SavePerspective()
+        
+        # Restore the layout from the last session
+        saved_perspective = self.config.get("viewer", "layout")
+        if saved_perspective:
+            self.aui_manager.LoadPerspective(saved_perspective, update=False)
+            self._show_session_panes()
+        
+        # Update the AUI manager
+        self.aui_manager.Update()
+        
+    def _create_session_panels(self):
+        """Create the chat, inventory and mini map panels if needed
+        
+        Returns:
+            bool: True if the panels were created
+        """
+        if self.chat_panel is not None:
+            return False
+            
+        self.chat_panel = ChatPanel(self)
+        self.inventory_panel = InventoryPanel(self)
+        self.mini_map = MiniMapPanel(self)
+        
         self.aui_manager.AddPane(
             self.chat_panel,
             aui.AuiPaneInfo().Name("chat").Bottom().Caption("Chat").
@@ -175,8 +203,47 @@ class MainWindow(wx.Frame):
             Show(self.is_logged_in)
         )
         
-        # Update the AUI manager
-        self.aui_manager.Update()
+        # These panes are not part of the default perspective
+        for name in ("chat", "inventory", "mini_map"):
+            pane = self.aui_manager.GetPane(name)
+            self._default_pane_info[name] = self.aui_manager.SavePaneInfo(pane)
+            
+        # Put them back where they were in the last session
+        saved_perspective = self.config.get("viewer", "layout")
+        if saved_perspective:
+            self.aui_manager.LoadPerspective(saved_perspective, update=False)
+            
+        return True
+        
+    def _show_session_panes(self):
+        """Show the panes that belong to the current login state
+        
+        Returns:
+            bool: True if any pane changed visibility
+        """
+        changed = False
+        for name, shown in (("login", not self.is_logged_in),
+                            ("chat", self.is_logged_in),
+                            ("inventory", self.is_logged_in),
+                            ("mini_map", self.is_logged_in)):
+            pane = self.aui_manager.GetPane(name)
+            if pane.IsOk() and pane.IsShown() != shown:
+                pane.Show(shown)
+                changed = True
+        return changed
+        
+    def _update_layout(self):
+        """Apply pending pane changes in one frozen layout pass"""
+        self.Freeze()
+        try:
+            self.aui_manager.Update()
+        finally:
+            self.Thaw()
+            
+    def _update_session_panes(self):
+        """Match pane visibility to the login state, updating only on change"""
+        if self._show_session_panes():
+            self._update_layout()
         
     def update_status(self, text, position=0):
         """Update the status bar text"""
@@ -197,23 +264,30 @@ class MainWindow(wx.Frame):
         self.user = User(user_data)
         
         # Update UI
-        self.aui_manager.GetPane("login").Hide()
-        self.aui_manager.GetPane("chat").Show()
-        self.aui_manager.GetPane("inventory").Show()
-        self.aui_manager.GetPane("mini_map").Show()
-        self.aui_manager.Update()
+        if self._create_session_panels():
+            self._show_session_panes()
+            self._update_layout()
+        else:
+            self._update_session_panes()
         
         # Update status
-        self.update_status(f"Logged in as {self.user.first_name} {self.user.last_name}")
+        self.update_status("Loading...")
         
-        # Notify components
-        self.world_view.on_login_success()
-        self.chat_panel.on_login_success()
-        self.inventory_panel.on_login_success()
-        self.mini_map.on_login_success()
+        # Notify components one event at a time so the window stays responsive
+        for component in (self.world_view, self.chat_panel,
+                          self.inventory_panel, self.mini_map):
+            wx.CallAfter(self._notify_login_success, component)
+        wx.CallAfter(self.update_status,
+                     f"Logged in as {self.user.first_name} {self.user.last_name}")
         
         self.logger.info(f"User logged in: {self.user.first_name} {self.user.last_name}")
     
+    def _notify_login_success(self, component):
+        """Notify a component of the login unless the session already ended"""
+        if not self.is_logged_in or self.IsBeingDeleted():
+            return
+        component.on_login_success()
+    
     def on_logout(self, event):
         """Handle logout request"""
         if self.is_logged_in:
@@ -240,20 +314,16 @@ class MainWindow(wx.Frame):
             self.user = User()
             
             # Update UI
-            self.aui_manager.GetPane("login").Show()
-            self.aui_manager.GetPane("chat").Hide()
-            self.aui_manager.GetPane("inventory").Hide()
-            self.aui_manager.GetPane("mini_map").Hide()
-            self.aui_manager.Update()
+            self._update_session_panes()
             
             # Update status
             self.update_status("Logged out")
             
             # Notify components
-            self.world_view.on_logout()
-            self.chat_panel.on_logout()
-            self.inventory_panel.on_logout()
-            self.mini_map.on_logout()
+            for component in (self.world_view, self.chat_panel,
+                              self.inventory_panel, self.mini_map):
+                if component is not None:
+                    component.on_logout()
             
             self.logger.info("User logged out")
     
@@ -272,52 +342,15 @@ class MainWindow(wx.Frame):
     
     def on_reset_layout(self, event):
         """Reset the window layout to default"""
-        # Save current state to detect what's visible
-        is_logged_in = self.is_logged_in
+        self.aui_manager.LoadPerspective(self._default_perspective, update=False)
         
-        # Close all panes
-        self.aui_manager.DetachPane(self.world_view)
-        self.aui_manager.DetachPane(self.login_panel)
-        self.aui_manager.DetachPane(self.chat_panel)
-        self.aui_manager.DetachPane(self.inventory_panel)
-        self.aui_manager.DetachPane(self.mini_map)
+        # Panes created after startup are not part of the default perspective
+        for name, pane_info in self._default_pane_info.items():
+            self.aui_manager.LoadPaneInfo(pane_info, self.aui_manager.GetPane(name))
         
-        # Recreate panes with default layout
-        self.aui_manager.AddPane(
-            self.world_view,
-            aui.AuiPaneInfo().Name("world_view").CenterPane().Caption("World View")
-        )
-        
-        self.aui_manager.AddPane(
-            self.login_panel,
-            aui.AuiPaneInfo().Name("login").Float().Caption("Login").
-            CloseButton(False).MaximizeButton(False).MinimizeButton(False).
-            Dockable(False).Show(not is_logged_in)
-        )
-        
-        self.aui_manager.AddPane(
-            self.chat_panel,
-            aui.AuiPaneInfo().Name("chat").Bottom().Caption("Chat").
-            BestSize(wx.Size(-1, 200)).MinSize(wx.Size(-1, 100)).
-            Show(is_logged_in)
-        )
-        
-        self.aui_manager.AddPane(
-            self.inventory_panel,
-            aui.AuiPaneInfo().Name("inventory").Right().Caption("Inventory").
-            BestSize(wx.Size(250, -1)).MinSize(wx.Size(200, -1)).
-            Show(is_logged_in)
-        )
-        
-        self.aui_manager.AddPane(
-            self.mini_map,
-            aui.AuiPaneInfo().Name("mini_map").Right().Caption("Mini Map").
-            BestSize(wx.Size(250, 250)).MinSize(wx.Size(200, 200)).
-            Show(is_logged_in)
-        )
-        
-        # Update the AUI manager
-        self.aui_manager.Update()
+        # The default layout was saved before login
+        self._show_session_panes()
+        self._update_layout()
         
         self.logger.info("Layout reset to default")
     
@@ -358,11 +391,11 @@ class MainWindow(wx.Frame):
         """Clean up and destroy the application"""
         self.logger.info("Shutting down application")
         
+        # Save configuration, including the current layout
+        self.config.set("viewer", "layout", self.aui_manager.SavePerspective())
+        
         # Uninit AUI manager
         self.aui_manager.UnInit()
         
-        # Save configuration
-        self.config.save_config()
-        
         # Destroy the window
         self.Destroy()
@@ -7,13 +7,35 @@ import wx
 import wx.lib.agw.floatspin as floatspin
 import logging
 import math
-import random
+import numpy as np
 import time
 import threading
 
+# Minimum seconds between redraws while dragging the map
+MOTION_REFRESH_INTERVAL = 1 / 60
+
+# Pixels around an avatar marker covered by its marker and direction line
+AVATAR_MARGIN = 20
+
+# Below this zoom other avatars are drawn as single points
+POINT_AVATAR_ZOOM = 0.75
+
+# Placeholder grid bitmaps kept (one per zoom level), and room for edge labels
+GRID_CACHE_SIZE = 8
+GRID_LABEL_PADDING = 48
+
 class MiniMapPanel(wx.Panel):
     """Panel for displaying mini map of the region"""
     
+    # Placeholder map bitmaps shared across logins, keyed by map size
+    _placeholder_cache = {}
+    
+    # Fixed seed so the placeholder map is the same every time
+    PLACEHOLDER_SEED = 256
+    
+    # Set once the shared pens and brushes exist (needs a wx.App)
+    _drawing_tools_created = False
+    
     def __init__(self, parent):
         """Initialize the mini map panel"""
         wx.Panel.__init__(self, parent)
@@ -36,13 +58,43 @@ class MiniMapPanel(wx.Panel):
         self.avatar_y = self.map_size / 2
         self.avatar_direction = 0  # In degrees, 0 is north/up
         
-        # Other avatars and objects
-        self.other_avatars = []  # List of {x, y, name} dictionaries
+        # Other avatars, positions and names share indexes
+        self._avatar_xy = np.empty((0, 2), dtype=np.float32)
+        self._avatar_names = []
         
         # Map data
         self.map_data = None
         self.map_bitmap = None
-        self.need_redraw = True
+        
+        # map_bitmap resampled for the current zoom
+        self._scaled_bitmap = None
+        self._scaled_key = None
+        
+        # Paint buffer, reallocated only when the canvas is resized
+        self._back_buffer = None
+        
+        # State of the last full frame in the paint buffer
+        self._last_paint_state = None
+        self._avatars_version = 0
+        
+        # Rendered placeholder grids, keyed by (zoom, map size)
+        self._grid_cache = {}
+        
+        # Grid intersection labels, keyed by (map size, grid spacing)
+        self._label_cache = {}
+        
+        # Avatar updates posted from other threads, applied on the UI thread
+        self._pending_lock = threading.Lock()
+        self._pending_avatar = None
+        self._pending_others = None
+        self._apply_scheduled = False
+        
+        # Drag redraw throttling
+        self._last_motion_refresh = 0.0
+        self._last_coord_int = None
+        
+        # Pens and brushes reused by every paint, created with the first panel
+        self._create_drawing_tools()
         
         # UI setup
         self._create_ui()
@@ -57,12 +109,27 @@ class MiniMapPanel(wx.Panel):
         
         self.zoom_slider.Bind(wx.EVT_SLIDER, self.on_zoom_change)
         
-        # Create update timer
-        self.timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.on_timer, self.timer)
-        
         self.logger.info("Mini map panel initialized")
         
+    @classmethod
+    def _create_drawing_tools(cls):
+        """Create the pens, brushes and colours shared by all mini maps"""
+        if cls._drawing_tools_created:
+            return
+            
+        cls._background_brush = wx.Brush(wx.Colour(50, 50, 50))
+        cls._avatar_brush = wx.Brush(wx.Colour(0, 200, 0))
+        cls._avatar_pen = wx.Pen(wx.Colour(0, 100, 0), 1)
+        cls._avatar_point_pen = wx.Pen(wx.Colour(0, 200, 0), 1)
+        cls._avatar_label_colour = wx.Colour(200, 255, 200)
+        cls._user_brush = wx.Brush(wx.Colour(255, 0, 0))
+        cls._user_pen = wx.Pen(wx.Colour(100, 0, 0), 1)
+        cls._direction_pen = wx.Pen(wx.Colour(255, 0, 0), 2)
+        cls._border_pen = wx.Pen(wx.Colour(200, 200, 200), 1, wx.PENSTYLE_DOT)
+        cls._grid_pen = wx.Pen(wx.Colour(100, 100, 100), 1, wx.PENSTYLE_DOT)
+        cls._grid_label_colour = wx.Colour(150, 150, 150)
+        cls._drawing_tools_created = True
+        
     def _create_ui(self):
         """Create UI elements"""
         # Main sizer
@@ -71,6 +138,7 @@ class MiniMapPanel(wx.Panel):
         # Create map canvas
         self.map_canvas = wx.Window(self, size=(250, 250), style=wx.BORDER_SIMPLE)
         self.map_canvas.SetBackgroundColour(wx.Colour(50, 50, 50))
+        self.map_canvas.SetBackgroundStyle(wx.BG_STYLE_PAINT)
         main_sizer.Add(self.map_canvas, 1, wx.EXPAND | wx.ALL, 5)
         
         # Create controls sizer
@@ -103,41 +171,78 @@ class MiniMapPanel(wx.Panel):
         
     def on_paint(self, event):
         """Handle paint event for the map canvas"""
-        dc = wx.BufferedPaintDC(self.map_canvas)
-        self.draw_map(dc)
+        if self._back_buffer is None:
+            self._resize_back_buffer()
+        dc = wx.BufferedPaintDC(self.map_canvas, self._back_buffer)
+        
+        # The buffer already holds this frame, let the DC blit it
+        state = self._paint_state()
+        if state == self._last_paint_state:
+            return
+            
+        clip = self.map_canvas.GetUpdateRegion().GetBox()
+        self.draw_map(dc, clip)
+        
+        # Partial paints leave culled avatars out of the buffer
+        width, height = self._back_buffer.GetSize()
+        if clip.IsEmpty() or clip.Contains(wx.Rect(0, 0, width, height)):
+            self._last_paint_state = state
+        else:
+            self._last_paint_state = None
+            
+    def _paint_state(self):
+        """Get everything that affects the drawn frame"""
+        return (
+            self.zoom,
+            self.center_x,
+            self.center_y,
+            self.avatar_x,
+            self.avatar_y,
+            self.avatar_direction,
+            id(self.map_bitmap),
+            self._avatars_version
+        )
         
     def on_size(self, event):
         """Handle resize event"""
+        self._resize_back_buffer()
+        
         # Force redraw on resize
-        self.need_redraw = True
         self.map_canvas.Refresh()
         event.Skip()
         
-    def draw_map(self, dc):
-        """Draw the mini map"""
+    def _resize_back_buffer(self):
+        """Allocate the paint buffer to match the canvas size"""
+        width, height = self.map_canvas.GetClientSize()
+        self._back_buffer = wx.Bitmap(max(width, 1), max(height, 1))
+        self._last_paint_state = None
+        
+    def draw_map(self, dc, clip=None):
+        """Draw the mini map, skipping avatars outside the clip rectangle"""
         # Get canvas size
         size = self.map_canvas.GetClientSize()
         width = size.width
         height = size.height
         
+        # Only avatars inside the damaged area need drawing
+        if clip is None or clip.IsEmpty():
+            clip = wx.Rect(0, 0, width, height)
+        
+        # Calculate scaling and top-left corner of the map view once per paint
+        scale = self.zoom
+        offset_x = (width * 0.5) - (self.center_x * scale)
+        offset_y = (height * 0.5) - (self.center_y * scale)
+        avatar_xy = self._avatar_xy
+        
         # Clear background
-        dc.SetBackground(wx.Brush(wx.Colour(50, 50, 50)))
+        dc.SetBackground(self._background_brush)
         dc.Clear()
         
         # Draw map background
         if self.map_bitmap:
-            # Calculate scaling and position
-            scale = self.zoom
-            map_width = self.map_size * scale
-            map_height = self.map_size * scale
-            
-            # Calculate top-left corner of the map view
-            offset_x = (width / 2) - (self.center_x * scale)
-            offset_y = (height / 2) - (self.center_y * scale)
-            
             # Draw the map bitmap
             dc.DrawBitmap(
-                self.map_bitmap,
+                self._scaled_map_bitmap(),
                 int(offset_x),
                 int(offset_y),
                 useMask=False
@@ -147,148 +252,208 @@ class MiniMapPanel(wx.Panel):
             self.draw_placeholder_grid(dc, width, height)
             
         # Draw other avatars
-        for avatar in self.other_avatars:
-            # Calculate position
-            scale = self.zoom
-            offset_x = (width / 2) - (self.center_x * scale)
-            offset_y = (height / 2) - (self.center_y * scale)
-            
-            x = int(offset_x + (avatar["x"] * scale))
-            y = int(offset_y + (avatar["y"] * scale))
+        if len(avatar_xy):
+            # Project all positions at once and skip those off the canvas
+            points = (avatar_xy * scale + (offset_x, offset_y)).astype(np.int32)
+            visible = np.flatnonzero(
+                (points[:, 0] >= clip.x - AVATAR_MARGIN) &
+                (points[:, 0] < clip.x + clip.width + AVATAR_MARGIN) &
+                (points[:, 1] >= clip.y - AVATAR_MARGIN) &
+                (points[:, 1] < clip.y + clip.height + AVATAR_MARGIN)
+            )
+            points = points[visible]
             
-            # Draw avatar marker
-            dc.SetBrush(wx.Brush(wx.Colour(0, 200, 0)))
-            dc.SetPen(wx.Pen(wx.Colour(0, 100, 0), 1))
-            dc.DrawCircle(x, y, 3)
+            if scale < POINT_AVATAR_ZOOM:
+                # Markers would shrink to a dot anyway
+                dc.SetPen(self._avatar_point_pen)
+                dc.DrawPointList(points.tolist())
+            else:
+                # Draw avatar markers in one call
+                markers = np.empty((len(points), 4), dtype=np.int32)
+                markers[:, :2] = points - 3
+                markers[:, 2:] = 6
+                dc.SetBrush(self._avatar_brush)
+                dc.SetPen(self._avatar_pen)
+                dc.DrawEllipseList(markers.tolist())
             
-            # Draw name if close enough
-            if self.zoom >= 1.0:
-                dc.SetTextForeground(wx.Colour(200, 255, 200))
-                dc.DrawText(avatar["name"], x + 5, y - 5)
+            # Draw names if close enough
+            if scale >= 1.0:
+                names = self._avatar_names
+                dc.SetTextForeground(self._avatar_label_colour)
+                dc.DrawTextList(
+                    [names[i] for i in visible],
+                    (points + (5, -5)).tolist()
+                )
         
         # Draw user's avatar
-        scale = self.zoom
-        offset_x = (width / 2) - (self.center_x * scale)
-        offset_y = (height / 2) - (self.center_y * scale)
-        
         x = int(offset_x + (self.avatar_x * scale))
         y = int(offset_y + (self.avatar_y * scale))
         
         # Draw avatar marker
-        dc.SetBrush(wx.Brush(wx.Colour(255, 0, 0)))
-        dc.SetPen(wx.Pen(wx.Colour(100, 0, 0), 1))
+        dc.SetBrush(self._user_brush)
+        dc.SetPen(self._user_pen)
         dc.DrawCircle(x, y, 5)
         
         # Draw direction indicator
+        sin, cos = math.sin, math.cos
         angle_rad = math.radians(self.avatar_direction)
-        dir_x = x + int(10 * math.sin(angle_rad))
-        dir_y = y - int(10 * math.cos(angle_rad))
-        dc.SetPen(wx.Pen(wx.Colour(255, 0, 0), 2))
+        dir_x = x + int(10 * sin(angle_rad))
+        dir_y = y - int(10 * cos(angle_rad))
+        dc.SetPen(self._direction_pen)
         dc.DrawLine(x, y, dir_x, dir_y)
         
         # Draw region borders
-        scale = self.zoom
-        offset_x = (width / 2) - (self.center_x * scale)
-        offset_y = (height / 2) - (self.center_y * scale)
-        
-        dc.SetPen(wx.Pen(wx.Colour(200, 200, 200), 1, wx.PENSTYLE_DOT))
+        dc.SetPen(self._border_pen)
         dc.SetBrush(wx.TRANSPARENT_BRUSH)
         
         # Draw main region border
-        dc.DrawRectangle(
-            int(offset_x),
-            int(offset_y),
-            int(self.map_size * scale),
-            int(self.map_size * scale)
-        )
+        extent = int(self.map_size * scale)
+        dc.DrawRectangle(int(offset_x), int(offset_y), extent, extent)
+        
+    def _scaled_map_bitmap(self):
+        """Get map_bitmap resampled to the current zoom"""
+        key = (id(self.map_bitmap), self.zoom)
+        if self._scaled_bitmap is None or self._scaled_key != key:
+            extent = max(int(self.map_size * self.zoom), 1)
+            image = self.map_bitmap.ConvertToImage()
+            image.Rescale(extent, extent, wx.IMAGE_QUALITY_BILINEAR)
+            self._scaled_bitmap = wx.Bitmap(image)
+            self._scaled_key = key
+        return self._scaled_bitmap
         
     def draw_placeholder_grid(self, dc, width, height):
         """Draw a placeholder grid when no map data is available"""
         # Get scale and offsets
         scale = self.zoom
-        offset_x = (width / 2) - (self.center_x * scale)
-        offset_y = (height / 2) - (self.center_y * scale)
+        offset_x = (width * 0.5) - (self.center_x * scale)
+        offset_y = (height * 0.5) - (self.center_y * scale)
+        
+        # The grid only depends on zoom and map size, so reuse its bitmap
+        key = (round(scale, 2), self.map_size)
+        bitmap = self._grid_cache.get(key)
+        if bitmap is None:
+            bitmap = self._render_placeholder_grid(scale)
+            self._grid_cache[key] = bitmap
+            
+            # Evict the oldest zoom level
+            if len(self._grid_cache) > GRID_CACHE_SIZE:
+                del self._grid_cache[next(iter(self._grid_cache))]
+                
+        dc.DrawBitmap(bitmap, int(offset_x), int(offset_y), useMask=False)
+        
+    def _render_placeholder_grid(self, scale):
+        """Render the placeholder grid for one zoom level into a bitmap"""
+        extent = int(self.map_size * scale)
+        bitmap = wx.Bitmap(extent + GRID_LABEL_PADDING, extent + GRID_LABEL_PADDING)
+        dc = wx.MemoryDC(bitmap)
+        
+        # Match the canvas background
+        dc.SetBackground(self._background_brush)
+        dc.Clear()
         
         # Set up drawing
-        dc.SetPen(wx.Pen(wx.Colour(100, 100, 100), 1, wx.PENSTYLE_DOT))
+        dc.SetPen(self._grid_pen)
         
         # Draw grid lines
         grid_spacing = 32  # Draw line every 32 units
+        steps = range(0, self.map_size + 1, grid_spacing)
+        draw_line = dc.DrawLine
         
         # Vertical lines
-        for x in range(0, self.map_size + 1, grid_spacing):
-            x_pos = int(offset_x + (x * scale))
-            dc.DrawLine(x_pos, int(offset_y), x_pos, int(offset_y + (self.map_size * scale)))
+        for x in steps:
+            x_pos = int(x * scale)
+            draw_line(x_pos, 0, x_pos, extent)
             
         # Horizontal lines
-        for y in range(0, self.map_size + 1, grid_spacing):
-            y_pos = int(offset_y + (y * scale))
-            dc.DrawLine(int(offset_x), y_pos, int(offset_x + (self.map_size * scale)), y_pos)
+        for y in steps:
+            y_pos = int(y * scale)
+            draw_line(0, y_pos, extent, y_pos)
             
-        # Draw coordinates at intersections
+        # Draw coordinates at intersections in one call
         if scale >= 1.0:
-            dc.SetTextForeground(wx.Colour(150, 150, 150))
-            for x in range(0, self.map_size + 1, grid_spacing):
-                for y in range(0, self.map_size + 1, grid_spacing):
-                    x_pos = int(offset_x + (x * scale))
-                    y_pos = int(offset_y + (y * scale))
-                    if 0 <= x_pos < width and 0 <= y_pos < height:
-                        dc.DrawText(f"{x},{y}", x_pos + 2, y_pos + 2)
+            labels, coords = self._grid_labels(grid_spacing)
+            dc.SetTextForeground(self._grid_label_colour)
+            dc.DrawTextList(
+                labels,
+                [(int(x * scale) + 2, int(y * scale) + 2) for x, y in coords]
+            )
+                    
+        # Release DC
+        dc.SelectObject(wx.NullBitmap)
+        
+        return bitmap
     
-    def create_placeholder_map(self):
-        """Create a placeholder map bitmap"""
-        # Create bitmap at 256x256 (1:1 scale)
-        bitmap = wx.Bitmap(self.map_size, self.map_size)
-        dc = wx.MemoryDC(bitmap)
+    def _grid_labels(self, grid_spacing):
+        """Get the intersection labels and their map coordinates"""
+        key = (self.map_size, grid_spacing)
+        cached = self._label_cache.get(key)
+        if cached is None:
+            steps = range(0, self.map_size + 1, grid_spacing)
+            coords = [(x, y) for x in steps for y in steps]
+            cached = ([f"{x},{y}" for x, y in coords], coords)
+            self._label_cache[key] = cached
+        return cached
+        
+    @staticmethod
+    def create_placeholder_map(map_size):
+        """Get the placeholder map bitmap, drawing it on first use"""
+        bitmap = MiniMapPanel._placeholder_cache.get(map_size)
+        if bitmap is None:
+            bitmap = MiniMapPanel._draw_placeholder_map(map_size)
+            MiniMapPanel._placeholder_cache[map_size] = bitmap
+        return bitmap
         
-        # Fill with base color
-        dc.SetBackground(wx.Brush(wx.Colour(100, 150, 100)))
-        dc.Clear()
+    @staticmethod
+    def _draw_placeholder_map(map_size):
+        """Draw a placeholder map bitmap"""
+        rng = np.random.default_rng(MiniMapPanel.PLACEHOLDER_SEED)
         
-        # Add some random terrain features
-        for _ in range(50):
-            x = random.randint(0, self.map_size - 1)
-            y = random.randint(0, self.map_size - 1)
-            size = random.randint(5, 20)
-            color = wx.Colour(
-                random.randint(70, 130),
-                random.randint(120, 200),
-                random.randint(70, 130)
-            )
-            dc.SetBrush(wx.Brush(color))
-            dc.SetPen(wx.TRANSPARENT_PEN)
-            dc.DrawCircle(x, y, size)
+        # Paint into an RGB array at 256x256 (1:1 scale) and convert once
+        pixels = np.empty((map_size, map_size, 3), dtype=np.uint8)
+        
+        # Fill with base color
+        pixels[:] = (100, 150, 100)
+        
+        # Add some random terrain features, x, y, size and color per row
+        features = rng.integers(
+            [0, 0, 5, 70, 120, 70],
+            [map_size - 1, map_size - 1, 20, 130, 200, 130],
+            size=(50, 6),
+            endpoint=True
+        )
+        rows, cols = np.ogrid[:map_size, :map_size]
+        for x, y, size, *color in features.tolist():
+            # Fill the circle within its bounding box
+            top, bottom = max(y - size, 0), min(y + size + 1, map_size)
+            left, right = max(x - size, 0), min(x + size + 1, map_size)
+            inside = ((cols[:, left:right] - x) ** 2 +
+                      (rows[top:bottom] - y) ** 2) <= size * size
+            pixels[top:bottom, left:right][inside] = color
             
         # Add some roads or paths
-        dc.SetPen(wx.Pen(wx.Colour(150, 150, 150), 3))
+        road_color = (150, 150, 150)
+        
+        y, x = rng.integers(50, map_size - 50, size=2, endpoint=True).tolist()
         
         # Horizontal road
-        y = random.randint(50, self.map_size - 50)
-        dc.DrawLine(0, y, self.map_size, y)
+        pixels[y - 1:y + 2, :] = road_color
         
         # Vertical road
-        x = random.randint(50, self.map_size - 50)
-        dc.DrawLine(x, 0, x, self.map_size)
-        
-        # Add a few "buildings"
-        for _ in range(10):
-            x = random.randint(10, self.map_size - 30)
-            y = random.randint(10, self.map_size - 30)
-            width = random.randint(10, 30)
-            height = random.randint(10, 30)
-            color = wx.Colour(
-                random.randint(150, 200),
-                random.randint(150, 200),
-                random.randint(150, 200)
-            )
-            dc.SetBrush(wx.Brush(color))
-            dc.SetPen(wx.Pen(wx.Colour(50, 50, 50), 1))
-            dc.DrawRectangle(x, y, width, height)
+        pixels[:, x - 1:x + 2] = road_color
+        
+        # Add a few "buildings", x, y, width, height and color per row
+        buildings = rng.integers(
+            [10, 10, 10, 10, 150, 150, 150],
+            [map_size - 30, map_size - 30, 30, 30, 200, 200, 200],
+            size=(10, 7),
+            endpoint=True
+        )
+        for x, y, width, height, *color in buildings.tolist():
+            building = pixels[y:y + height, x:x + width]
+            building[:] = (50, 50, 50)
+            building[1:-1, 1:-1] = color
             
-        # Release DC
-        dc.SelectObject(wx.NullBitmap)
-        
-        return bitmap
+        return wx.Bitmap.FromBuffer(map_size, map_size, pixels)
         
     def on_mouse_down(self, event):
         """Handle mouse down event"""
@@ -298,11 +463,17 @@ class MiniMapPanel(wx.Panel):
         self.drag_center_x = self.center_x
         self.drag_center_y = self.center_y
         
+        # Motion converts with a multiply, zoom changes keep this current
+        self._drag_inv_scale = 1.0 / self.zoom
+        
     def on_mouse_up(self, event):
         """Handle mouse up event"""
         if self.map_canvas.HasCapture():
             self.map_canvas.ReleaseMouse()
             
+            # Show the final drag position even if its motion was throttled
+            self.map_canvas.Refresh()
+            
     def on_mouse_motion(self, event):
         """Handle mouse motion event"""
         # Only process if dragging
@@ -311,21 +482,21 @@ class MiniMapPanel(wx.Panel):
             dx = event.GetX() - self.drag_start_x
             dy = event.GetY() - self.drag_start_y
             
-            # Convert to map space
-            scale = self.zoom
-            map_dx = dx / scale
-            map_dy = dy / scale
-            
-            # Update center position (move opposite to drag direction)
-            self.center_x = self.drag_center_x - map_dx
-            self.center_y = self.drag_center_y - map_dy
+            # Move the center opposite to the drag, in map space
+            inv_scale = self._drag_inv_scale
+            map_size = self.map_size
+            cx = self.drag_center_x - dx * inv_scale
+            cy = self.drag_center_y - dy * inv_scale
             
             # Ensure center stays within reasonable bounds
-            self.center_x = max(0, min(self.map_size, self.center_x))
-            self.center_y = max(0, min(self.map_size, self.center_y))
+            self.center_x = 0.0 if cx < 0 else map_size if cx > map_size else cx
+            self.center_y = 0.0 if cy < 0 else map_size if cy > map_size else cy
             
-            # Redraw
-            self.map_canvas.Refresh()
+            # Redraw, at most ~60 times a second while dragging
+            now = time.monotonic()
+            if now - self._last_motion_refresh >= MOTION_REFRESH_INTERVAL:
+                self.map_canvas.Refresh()
+                self._last_motion_refresh = now
             
         # Update coordinate display if mouse is over map
         if not event.Dragging():
@@ -337,9 +508,12 @@ class MiniMapPanel(wx.Panel):
             map_x = self.center_x + ((event.GetX() - (size.width / 2)) / scale)
             map_y = self.center_y + ((event.GetY() - (size.height / 2)) / scale)
             
-            # Update coordinate text if within map bounds
+            # Update coordinate text if within map bounds and changed
             if 0 <= map_x <= self.map_size and 0 <= map_y <= self.map_size:
-                self.coord_text.SetLabel(f"X: {int(map_x)}, Y: {int(map_y)}")
+                coord_int = (int(map_x), int(map_y))
+                if coord_int != self._last_coord_int:
+                    self._last_coord_int = coord_int
+                    self.coord_text.SetLabel(f"X: {coord_int[0]}, Y: {coord_int[1]}")
             
     def on_mouse_wheel(self, event):
         """Handle mouse wheel for zoom"""
@@ -356,6 +530,8 @@ class MiniMapPanel(wx.Panel):
         # Update zoom
         if new_zoom != self.zoom:
             self.zoom = new_zoom
+            self._drag_inv_scale = 1.0 / new_zoom
+            self._scaled_bitmap = None
             
             # Update zoom slider
             self.zoom_slider.SetValue(int(self.zoom * 10))
@@ -371,74 +547,172 @@ class MiniMapPanel(wx.Panel):
         # Update zoom
         if new_zoom != self.zoom:
             self.zoom = new_zoom
+            self._drag_inv_scale = 1.0 / new_zoom
+            self._scaled_bitmap = None
             
             # Redraw
             self.map_canvas.Refresh()
             
-    def on_timer(self, event):
-        """Handle timer event for updates"""
-        # In a full implementation, this would update based on viewer state
-        # For now, just reload if needed
-        if self.need_redraw:
-            self.map_canvas.Refresh()
-            self.need_redraw = False
-    
     def update_avatar_position(self, x, y, direction):
-        """Update the user's avatar position"""
+        """Update the user's avatar position (any thread)"""
+        with self._pending_lock:
+            self._pending_avatar = (x, y, direction)
+            self._schedule_apply()
+            
+    def update_other_avatars(self, avatars):
+        """Update positions of other avatars (any thread)
+        
+        Args:
+            avatars: List of {x, y, name} dictionaries
+        """
+        with self._pending_lock:
+            self._pending_others = list(avatars)
+            self._schedule_apply()
+            
+    def _schedule_apply(self):
+        """Post one _apply_updates call for a burst of updates (lock held)"""
+        if not self._apply_scheduled:
+            self._apply_scheduled = True
+            wx.CallAfter(self._apply_updates)
+            
+    def _apply_updates(self):
+        """Apply the latest pending avatar updates (UI thread)"""
+        # The panel may have been destroyed while the call was queued
+        if not self or self.IsBeingDeleted():
+            return
+            
+        with self._pending_lock:
+            avatar = self._pending_avatar
+            others = self._pending_others
+            self._pending_avatar = None
+            self._pending_others = None
+            self._apply_scheduled = False
+            
+        if avatar is not None:
+            self._apply_avatar_position(*avatar)
+        if others is not None:
+            self._apply_other_avatars(others)
+            
+    def _apply_avatar_position(self, x, y, direction):
+        """Move the user's avatar and repaint what changed"""
+        moved = (x, y) != (self.avatar_x, self.avatar_y)
+        turned = direction != self.avatar_direction
+        
+        # Nothing visible changed
+        if not moved and not turned:
+            return
+            
         self.avatar_x = x
         self.avatar_y = y
         self.avatar_direction = direction
         
-        # Center map on avatar if tracking
-        self.center_x = x
-        self.center_y = y
-        
-        # Update coordinate text
-        self.coord_text.SetLabel(f"X: {int(x)}, Y: {int(y)}")
-        
-        # Redraw
-        self.map_canvas.Refresh()
+        if moved:
+            # Center map on avatar if tracking, which scrolls the whole map
+            self.center_x = x
+            self.center_y = y
+            
+            # Update coordinate text
+            self._last_coord_int = (int(x), int(y))
+            self.coord_text.SetLabel(f"X: {int(x)}, Y: {int(y)}")
+            
+            # Redraw
+            self.map_canvas.Refresh()
+        else:
+            # Only the direction indicator changed
+            screen_x, screen_y = self._project(x, y)
+            self.map_canvas.RefreshRect(
+                wx.Rect(
+                    screen_x - AVATAR_MARGIN,
+                    screen_y - AVATAR_MARGIN,
+                    AVATAR_MARGIN * 2,
+                    AVATAR_MARGIN * 2
+                ),
+                eraseBackground=False
+            )
+            
+    def _project(self, x, y):
+        """Convert map coordinates to canvas pixel coordinates"""
+        size = self.map_canvas.GetClientSize()
+        scale = self.zoom
+        screen_x = int((size.width * 0.5) + ((x - self.center_x) * scale))
+        screen_y = int((size.height * 0.5) + ((y - self.center_y) * scale))
+        return screen_x, screen_y
+        
+    def _apply_other_avatars(self, avatars):
+        """Replace the other avatars and repaint what changed"""
+        old_xy = self._avatar_xy
+        old_names = self._avatar_names
+        self._set_other_avatars(avatars)
+        
+        # Repaint only the area covering the old and new markers
+        all_xy = np.concatenate((old_xy, self._avatar_xy))
+        if not len(all_xy):
+            return
+            
+        size = self.map_canvas.GetClientSize()
+        scale = self.zoom
+        screen = (all_xy - (self.center_x, self.center_y)) * scale
+        screen += (size.width * 0.5, size.height * 0.5)
+        left, top = screen.min(axis=0)
+        right, bottom = screen.max(axis=0)
+        
+        # Leave room for the name labels to the right of the markers
+        names = old_names + self._avatar_names
+        label_width = max(self.map_canvas.GetTextExtent(name)[0] for name in names)
+        
+        self.map_canvas.RefreshRect(
+            wx.Rect(
+                int(left) - AVATAR_MARGIN,
+                int(top) - AVATAR_MARGIN,
+                int(right - left) + label_width + AVATAR_MARGIN * 2,
+                int(bottom - top) + AVATAR_MARGIN * 2
+            ),
+            eraseBackground=False
+        )
         
-    def update_other_avatars(self, avatars):
-        """Update positions of other avatars"""
-        self.other_avatars = avatars
-        self.map_canvas.Refresh()
+    def _set_other_avatars(self, avatars):
+        """Store other avatars as a position array and a name list"""
+        self._avatars_version += 1
+        self._avatar_xy = np.array(
+            [(avatar["x"], avatar["y"]) for avatar in avatars],
+            dtype=np.float32
+        ).reshape(-1, 2)
+        self._avatar_names = [avatar["name"] for avatar in avatars]
     
     def on_login_success(self):
         """Handle successful login"""
         # Create placeholder map
-        self.map_bitmap = self.create_placeholder_map()
+        self.map_bitmap = self.create_placeholder_map(self.map_size)
         
         # Set up sample avatars
         self.avatar_x = 128
         self.avatar_y = 128
         self.avatar_direction = 0
         
-        self.other_avatars = [
+        self._set_other_avatars([
             {"x": 100, "y": 100, "name": "User1"},
             {"x": 150, "y": 120, "name": "User2"},
             {"x": 90, "y": 180, "name": "User3"}
-        ]
+        ])
         
         # Center map on avatar
         self.center_x = self.avatar_x
         self.center_y = self.avatar_y
         
-        # Start update timer (4 fps is enough for minimap)
-        self.timer.Start(250)
-        
         # Force redraw
-        self.need_redraw = True
         self.map_canvas.Refresh()
         
     def on_logout(self):
         """Handle logout"""
-        # Stop timer
-        self.timer.Stop()
-        
+        # Drop updates still queued from the old session
+        with self._pending_lock:
+            self._pending_avatar = None
+            self._pending_others = None
+            
         # Clear map data
         self.map_bitmap = None
-        self.other_avatars = []
+        self._scaled_bitmap = None
+        self._set_other_avatars([])
         
         # Reset view
         self.avatar_x = self.map_size / 2
@@ -449,5 +723,4 @@ class MiniMapPanel(wx.Panel):
         self.zoom_slider.SetValue(10)
         
         # Force redraw
-        self.need_redraw = True
         self.map_canvas.Refresh()
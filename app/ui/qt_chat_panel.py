@@ -3,13 +3,30 @@ Chat panel for the KitelyView viewer using PyQt5.
 Handles in-world chat and messaging.
 """
 
+import collections
+import functools
 import logging
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, 
     QLineEdit, QPushButton, QComboBox, QLabel
 )
-from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui import QFont, QTextCursor
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QFont, QTextCursor, QTextCharFormat, QColor
+
+# Chat lines kept when the config doesn't set viewer.chat_scrollback
+DEFAULT_CHAT_SCROLLBACK = 2000
+
+# Scroll steps from the bottom that still count as following the chat
+SCROLL_PIN_TOLERANCE = 4
+
+# Incoming messages are written at most this often (ms), oldest dropped past the cap
+CHAT_FLUSH_INTERVAL = 33
+MAX_PENDING_MESSAGES = 5000
+
+@functools.lru_cache(maxsize=16)
+def _channel_prefix(channel):
+    """Get the "[channel] " prefix, there are only a handful of channels"""
+    return f"[{channel}] "
 
 class ChatPanel(QWidget):
     """Panel for handling in-world chat"""
@@ -25,9 +42,25 @@ class ChatPanel(QWidget):
         # Store parent reference (MainWindow)
         self.main_window = parent
         
+        # Name shown on our own messages, set on login
+        self._cached_sender = "You"
+        
+        # Character formats for the parts of a chat line
+        self._fmt_channel = QTextCharFormat()
+        self._fmt_channel.setFontWeight(QFont.Bold)
+        self._fmt_sender = QTextCharFormat()
+        self._fmt_sender.setForeground(QColor("blue"))
+        self._fmt_text = QTextCharFormat()
+        
         # Create UI elements
         self._create_ui()
         
+        # Incoming messages wait here and are written in batches
+        self._pending = collections.deque(maxlen=MAX_PENDING_MESSAGES)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(CHAT_FLUSH_INTERVAL)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        
         self.logger.info("Chat panel initialized")
         
     def _create_ui(self):
@@ -38,9 +71,13 @@ class ChatPanel(QWidget):
         main_layout.setSpacing(5)
         
         # Create chat text display
-        self.chat_display = QTextEdit()
+        self.chat_display = QPlainTextEdit()
         self.chat_display.setReadOnly(True)
-        self.chat_display.setLineWrapMode(QTextEdit.WidgetWidth)
+        self.chat_display.setLineWrapMode(QPlainTextEdit.WidgetWidth)
+        
+        # Drop the oldest lines once the scrollback is full
+        scrollback = self.main_window.config.get("viewer", "chat_scrollback")
+        self.chat_display.setMaximumBlockCount(scrollback or DEFAULT_CHAT_SCROLLBACK)
         
         # Create channel selector
         channel_layout = QHBoxLayout()
@@ -82,32 +119,83 @@ class ChatPanel(QWidget):
             self.logger.info(f"Chat message: ({channel}) {text}")
             
             # Add message to display (in real app would be sent to server)
-            sender = self.main_window.user.get_full_name() if self.main_window.is_logged_in else "You"
-            self.add_chat_message(sender, text, channel)
+            self.add_chat_message(self._cached_sender, text, channel)
             
             # Clear input
             self.chat_input.clear()
     
     def add_chat_message(self, sender, text, channel="Local"):
         """Add a chat message to the display"""
-        cursor = self.chat_display.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        
-        # Format based on channel
-        format_html = f"<b>[{channel}]</b> <span style='color: blue;'>{sender}:</span> {text}"
-        
-        # Add to display
-        cursor.insertHtml(format_html + "<br>")
+        self.add_chat_messages([(sender, text, channel)])
         
-        # Scroll to bottom
-        self.chat_display.setTextCursor(cursor)
-        self.chat_display.ensureCursorVisible()
+    def add_chat_messages(self, messages):
+        """Add several chat messages with a single layout and repaint
         
+        Args:
+            messages: List of (sender, text, channel) tuples
+        """
+        if not messages:
+            return
+            
+        # Users reading back through history shouldn't be yanked down
+        scrollbar = self.chat_display.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - SCROLL_PIN_TOLERANCE
+        
+        self.chat_display.setUpdatesEnabled(False)
+        try:
+            cursor = QTextCursor(self.chat_display.document())
+            cursor.movePosition(QTextCursor.End)
+            cursor.beginEditBlock()
+            for sender, text, channel in messages:
+                self._insert_message(cursor, sender, text, channel)
+            cursor.endEditBlock()
+        finally:
+            self.chat_display.setUpdatesEnabled(True)
+        
+        # Follow new messages only if already at the bottom
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+            
+    def queue_chat_message(self, sender, text, channel="Local"):
+        """Queue an incoming message for the next batch (any thread)"""
+        self._pending.append((sender, text, channel))
+        
+    def _flush_pending(self):
+        """Write all queued messages in one batch"""
+        if not self._pending:
+            return
+        messages = []
+        while self._pending:
+            messages.append(self._pending.popleft())
+        self.add_chat_messages(messages)
+        
+    def _insert_message(self, cursor, sender, text, channel):
+        """Insert one chat line at the cursor as plain text with formats"""
+        if not self.chat_display.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(_channel_prefix(channel), self._fmt_channel)
+        cursor.insertText(f"{sender}: ", self._fmt_sender)
+        cursor.insertText(text, self._fmt_text)
+        
+    def pause_refresh(self):
+        """Hold queued messages while the panel is hidden"""
+        self._flush_timer.stop()
+        
+    def resume_refresh(self):
+        """Resume writing queued messages once the panel is shown again"""
+        if self.main_window.is_logged_in and not self._flush_timer.isActive():
+            self._flush_timer.start()
+            
     def on_login_success(self):
         """Handle successful login"""
+        self._cached_sender = self.main_window.user.full_name
+        self._flush_timer.start()
         self.add_chat_message("System", "Welcome to Kitely! You are now connected.", "System")
         
     def on_logout(self):
         """Handle logout"""
+        self._cached_sender = "You"
+        self._flush_timer.stop()
+        self._pending.clear()
         self.chat_display.clear()
         self.chat_input.clear()
\ No newline at end of file
@@ -3,14 +3,184 @@ Inventory panel for the KitelyView viewer using PyQt5.
 Displays and manages the user's inventory items.
 """
 
+import fnmatch
 import logging
+import re
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem,
-    QPushButton, QMenu, QAction, QLabel, QComboBox, QLineEdit, QToolBar
+    QWidget, QVBoxLayout, QHBoxLayout, QTreeView,
+    QPushButton, QMenu, QAction, QComboBox, QLineEdit, QToolBar
 )
-from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui import QIcon
-from app.models.inventory import InventoryFolder, InventoryItem
+from PyQt5.QtCore import (
+    Qt, QSize, QTimer, QAbstractItemModel, QModelIndex, QSortFilterProxyModel
+)
+
+# Quiet period after the last keystroke before the search runs
+SEARCH_DEBOUNCE_MS = 150
+
+class InventoryNode:
+    """A folder or item row in the inventory model"""
+    
+    __slots__ = ("name", "item_type", "name_lower", "parent", "children", "row")
+    
+    def __init__(self, name, item_type, parent=None):
+        """Create the node and append it to its parent's children"""
+        self.name = name
+        self.item_type = item_type
+        self.name_lower = name.lower()
+        self.parent = parent
+        self.children = []
+        self.row = 0
+        
+        if parent is not None:
+            self.row = len(parent.children)
+            parent.children.append(self)
+
+
+class InventoryModel(QAbstractItemModel):
+    """Two-column (name, type) tree model over InventoryNode objects"""
+    
+    HEADERS = ("Name", "Type")
+    
+    def __init__(self, parent=None):
+        """Initialize an empty model"""
+        super(InventoryModel, self).__init__(parent)
+        self._root = InventoryNode("", "")
+        
+    def node(self, index):
+        """Get the node for an index, the hidden root for an invalid one"""
+        return index.internalPointer() if index.isValid() else self._root
+        
+    def set_root(self, root):
+        """Replace the whole tree, children of root become top-level rows"""
+        self.beginResetModel()
+        self._root = root
+        self.endResetModel()
+        
+    def clear(self):
+        """Remove all rows"""
+        self.set_root(InventoryNode("", ""))
+        
+    def add_node(self, parent_index, name, item_type):
+        """Append a row under parent_index and return its index"""
+        return self.add_nodes(parent_index, [(name, item_type)])
+        
+    def add_nodes(self, parent_index, entries):
+        """Append rows under parent_index with a single insert notification
+        
+        Args:
+            parent_index: Index of the folder to add to
+            entries: List of (name, item_type) tuples
+            
+        Returns:
+            QModelIndex: Index of the first new row
+        """
+        if not entries:
+            return QModelIndex()
+            
+        parent = self.node(parent_index)
+        first = len(parent.children)
+        self.beginInsertRows(parent_index, first, first + len(entries) - 1)
+        for name, item_type in entries:
+            InventoryNode(name, item_type, parent)
+        self.endInsertRows()
+        return self.index(first, 0, parent_index)
+        
+    def index(self, row, column, parent=QModelIndex()):
+        """Create the index for a row under parent"""
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self.node(parent).children[row])
+        
+    def parent(self, index):
+        """Get the parent index of an index"""
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+        
+    def rowCount(self, parent=QModelIndex()):
+        """Number of children under parent"""
+        if parent.column() > 0:
+            return 0
+        return len(self.node(parent).children)
+        
+    def columnCount(self, parent=QModelIndex()):
+        """Name and type columns"""
+        return len(self.HEADERS)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        """Get the text of a cell, or the lower-cased name for UserRole"""
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return node.name if index.column() == 0 else node.item_type
+        if role == Qt.UserRole:
+            return node.name_lower
+        return None
+        
+    def setData(self, index, value, role=Qt.EditRole):
+        """Rename a node"""
+        if role != Qt.EditRole or index.column() != 0 or not value:
+            return False
+        node = index.internalPointer()
+        node.name = value
+        node.name_lower = value.lower()
+        self.dataChanged.emit(index, index)
+        return True
+        
+    def flags(self, index):
+        """Folder names can be edited in place"""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == 0 and index.internalPointer().item_type == "Folder":
+            flags |= Qt.ItemIsEditable
+        return flags
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Column titles"""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
+class InventoryFilterProxy(QSortFilterProxyModel):
+    """Shows rows whose name, or a descendant's name, contains the search text"""
+    
+    def __init__(self, parent=None):
+        """Initialize with no search text"""
+        super(InventoryFilterProxy, self).__init__(parent)
+        self._matches = None
+        
+        # Qt keeps the ancestors of accepted rows, so rows only test themselves
+        self.setRecursiveFilteringEnabled(True)
+        
+    def set_search_text(self, text):
+        """Filter on a new search text, * ? and [] act as wildcards"""
+        self._matches = self._build_predicate(text)
+        self.invalidateFilter()
+        
+    @staticmethod
+    def _build_predicate(text):
+        """Turn the search text into a name test, built once per search"""
+        if not text:
+            return None
+        if any(c in text for c in "*?["):
+            return re.compile(fnmatch.translate(f"*{text}*"), re.IGNORECASE).match
+        needle = text.lower()
+        return lambda name_lower: needle in name_lower
+        
+    def filterAcceptsRow(self, source_row, source_parent):
+        """Accept a row if its name matches"""
+        if self._matches is None:
+            return True
+        source = self.sourceModel()
+        node = source.node(source.index(source_row, 0, source_parent))
+        return self._matches(node.name_lower)
+
 
 class InventoryPanel(QWidget):
     """Panel for displaying user inventory"""
@@ -58,12 +228,22 @@ class InventoryPanel(QWidget):
         # Add toolbar to layout
         main_layout.addWidget(toolbar)
         
-        # Create tree widget for inventory
-        self.inventory_tree = QTreeWidget()
-        self.inventory_tree.setHeaderLabels(["Name", "Type"])
+        # Create tree view over a filterable inventory model
+        self.inventory_model = InventoryModel(self)
+        self.inventory_proxy = InventoryFilterProxy(self)
+        self.inventory_proxy.setSourceModel(self.inventory_model)
+        
+        self.inventory_tree = QTreeView()
+        self.inventory_tree.setModel(self.inventory_proxy)
+        
+        # Every row is one line of text, skip per-row height probing
+        self.inventory_tree.setUniformRowHeights(True)
+        self.inventory_tree.setExpandsOnDoubleClick(True)
+        self.inventory_tree.setAnimated(False)
         self.inventory_tree.setColumnWidth(0, 180)
         self.inventory_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.inventory_tree.customContextMenuRequested.connect(self.show_context_menu)
+        self._create_context_menu()
         
         # Add tree to layout
         main_layout.addWidget(self.inventory_tree)
@@ -81,60 +261,70 @@ class InventoryPanel(QWidget):
         # Set main layout
         self.setLayout(main_layout)
         
+        # Run the search once typing pauses, not on every keystroke
+        self._pending_filter_text = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._run_pending_filter)
+        
         # Connect signals
         self.refresh_button.clicked.connect(self.refresh_inventory)
         self.create_button.clicked.connect(self.create_new_folder)
-        self.search_input.textChanged.connect(self.filter_inventory)
+        self.search_input.textChanged.connect(self.on_search_text_changed)
         self.filter_combo.currentIndexChanged.connect(self.apply_filter)
         
-    def show_context_menu(self, position):
-        """Show context menu for inventory items"""
-        # Get the tree item at the position
-        item = self.inventory_tree.itemAt(position)
-        if not item:
-            return
-            
-        # Create context menu
-        menu = QMenu()
+    def _create_context_menu(self):
+        """Build the item context menu once, handlers act on _ctx_item"""
+        self._ctx_item = None
+        self._ctx_menu = QMenu(self)
         
         # Add actions
-        open_action = QAction("Open", self)
-        wear_action = QAction("Wear", self)
-        properties_action = QAction("Properties", self)
-        delete_action = QAction("Delete", self)
+        self._act_open = QAction("Open", self)
+        self._act_wear = QAction("Wear", self)
+        self._act_properties = QAction("Properties", self)
+        self._act_delete = QAction("Delete", self)
         
         # Add actions to menu
-        menu.addAction(open_action)
-        menu.addAction(wear_action)
-        menu.addSeparator()
-        menu.addAction(properties_action)
-        menu.addSeparator()
-        menu.addAction(delete_action)
+        self._ctx_menu.addAction(self._act_open)
+        self._ctx_menu.addAction(self._act_wear)
+        self._ctx_menu.addSeparator()
+        self._ctx_menu.addAction(self._act_properties)
+        self._ctx_menu.addSeparator()
+        self._ctx_menu.addAction(self._act_delete)
         
         # Connect signals
-        open_action.triggered.connect(lambda: self.on_item_open(item))
-        wear_action.triggered.connect(lambda: self.on_item_wear(item))
-        properties_action.triggered.connect(lambda: self.on_item_properties(item))
-        delete_action.triggered.connect(lambda: self.on_item_delete(item))
+        self._act_open.triggered.connect(lambda: self.on_item_open(self._ctx_item))
+        self._act_wear.triggered.connect(lambda: self.on_item_wear(self._ctx_item))
+        self._act_properties.triggered.connect(lambda: self.on_item_properties(self._ctx_item))
+        self._act_delete.triggered.connect(lambda: self.on_item_delete(self._ctx_item))
+        
+    def show_context_menu(self, position):
+        """Show context menu for inventory items"""
+        # Get the inventory node at the position
+        index = self.inventory_tree.indexAt(position)
+        if not index.isValid():
+            return
+        self._ctx_item = self.inventory_model.node(self.inventory_proxy.mapToSource(index))
         
         # Show menu
-        menu.exec_(self.inventory_tree.viewport().mapToGlobal(position))
+        self._ctx_menu.exec_(self.inventory_tree.viewport().mapToGlobal(position))
         
     def on_item_open(self, item):
         """Handle opening an inventory item"""
-        self.logger.info(f"Opening inventory item: {item.text(0)}")
+        self.logger.info(f"Opening inventory item: {item.name}")
         
     def on_item_wear(self, item):
         """Handle wearing an inventory item"""
-        self.logger.info(f"Wearing inventory item: {item.text(0)}")
+        self.logger.info(f"Wearing inventory item: {item.name}")
         
     def on_item_properties(self, item):
         """Handle showing properties for an inventory item"""
-        self.logger.info(f"Showing properties for inventory item: {item.text(0)}")
+        self.logger.info(f"Showing properties for inventory item: {item.name}")
         
     def on_item_delete(self, item):
         """Handle deleting an inventory item"""
-        self.logger.info(f"Deleting inventory item: {item.text(0)}")
+        self.logger.info(f"Deleting inventory item: {item.name}")
         
     def refresh_inventory(self):
         """Refresh the inventory display"""
@@ -146,55 +336,34 @@ class InventoryPanel(QWidget):
     def create_new_folder(self):
         """Create a new folder in the inventory"""
         self.logger.info("Creating new folder")
-        # Add a new folder item to the tree
-        current_item = self.inventory_tree.currentItem()
-        parent = current_item if current_item else self.inventory_tree.invisibleRootItem()
+        # Add a new folder under the current row, or at the top level
+        current = self.inventory_tree.currentIndex()
+        parent = self.inventory_proxy.mapToSource(current.sibling(current.row(), 0))
         
-        new_folder = QTreeWidgetItem(parent)
-        new_folder.setText(0, "New Folder")
-        new_folder.setText(1, "Folder")
-        new_folder.setFlags(new_folder.flags() | Qt.ItemIsEditable)
+        new_folder = self.inventory_proxy.mapFromSource(
+            self.inventory_model.add_node(parent, "New Folder", "Folder")
+        )
         
         # Expand parent
-        parent.setExpanded(True)
+        if current.isValid():
+            self.inventory_tree.expand(current.sibling(current.row(), 0))
         
         # Set focus and start editing
-        self.inventory_tree.setCurrentItem(new_folder)
-        self.inventory_tree.editItem(new_folder, 0)
+        self.inventory_tree.setCurrentIndex(new_folder)
+        self.inventory_tree.edit(new_folder)
+        
+    def on_search_text_changed(self, text):
+        """Restart the search debounce with the latest text"""
+        self._pending_filter_text = text
+        self._filter_timer.start()
+        
+    def _run_pending_filter(self):
+        """Filter with the text from the last keystroke"""
+        self.filter_inventory(self._pending_filter_text)
         
     def filter_inventory(self, text):
         """Filter inventory items by name"""
-        # Hide items that don't match the search text
-        if not text:
-            # Show all items
-            for i in range(self.inventory_tree.topLevelItemCount()):
-                self._set_item_visible(self.inventory_tree.topLevelItem(i), True)
-        else:
-            # Hide items that don't match
-            for i in range(self.inventory_tree.topLevelItemCount()):
-                item = self.inventory_tree.topLevelItem(i)
-                self._filter_item(item, text.lower())
-                
-    def _filter_item(self, item, text):
-        """Recursively filter item and its children"""
-        visible = False
-        
-        # Check if this item matches
-        if text in item.text(0).lower():
-            visible = True
-        
-        # Check children
-        for i in range(item.childCount()):
-            if self._filter_item(item.child(i), text):
-                visible = True
-                
-        # Set visibility
-        self._set_item_visible(item, visible)
-        return visible
-        
-    def _set_item_visible(self, item, visible):
-        """Set item visibility in tree"""
-        item.setHidden(not visible)
+        self.inventory_proxy.set_search_text(text)
         
     def apply_filter(self, index):
         """Apply a filter to the inventory"""
@@ -205,27 +374,19 @@ class InventoryPanel(QWidget):
         
     def _populate_sample_data(self):
         """Populate the inventory tree with sample data"""
-        self.inventory_tree.clear()
+        # Build the tree off-model and hand it over in one reset
+        self.inventory_tree.setUpdatesEnabled(False)
+        top = InventoryNode("", "")
         
         # Create root folder
-        self.root_folder = QTreeWidgetItem(self.inventory_tree)
-        self.root_folder.setText(0, "My Inventory")
-        self.root_folder.setText(1, "Root")
+        self.root_folder = InventoryNode("My Inventory", "Root", top)
         
         # Create some standard folders
         folders = {
-            "Clothing": QTreeWidgetItem(self.root_folder),
-            "Objects": QTreeWidgetItem(self.root_folder),
-            "Textures": QTreeWidgetItem(self.root_folder),
-            "Animations": QTreeWidgetItem(self.root_folder),
-            "Landmarks": QTreeWidgetItem(self.root_folder)
+            name: InventoryNode(name, "Folder", self.root_folder)
+            for name in ("Clothing", "Objects", "Textures", "Animations", "Landmarks")
         }
         
-        # Set folder names
-        for name, item in folders.items():
-            item.setText(0, name)
-            item.setText(1, "Folder")
-        
         # Add some sample items to folders
         clothing_items = [
             ("Blue Shirt", "Clothing"),
@@ -247,24 +408,23 @@ class InventoryPanel(QWidget):
         
         # Add clothing items
         for name, item_type in clothing_items:
-            item = QTreeWidgetItem(folders["Clothing"])
-            item.setText(0, name)
-            item.setText(1, item_type)
+            InventoryNode(name, item_type, folders["Clothing"])
             
         # Add object items
         for name, item_type in object_items:
-            item = QTreeWidgetItem(folders["Objects"])
-            item.setText(0, name)
-            item.setText(1, item_type)
+            InventoryNode(name, item_type, folders["Objects"])
             
         # Add texture items
         for name, item_type in texture_items:
-            item = QTreeWidgetItem(folders["Textures"])
-            item.setText(0, name)
-            item.setText(1, item_type)
+            InventoryNode(name, item_type, folders["Textures"])
             
+        self.inventory_model.set_root(top)
+        
         # Expand root folder
-        self.root_folder.setExpanded(True)
+        self.inventory_tree.expand(
+            self.inventory_proxy.mapFromSource(self.inventory_model.index(0, 0))
+        )
+        self.inventory_tree.setUpdatesEnabled(True)
         
     def on_login_success(self):
         """Handle successful login"""
@@ -274,5 +434,5 @@ class InventoryPanel(QWidget):
     def on_logout(self):
         """Handle logout"""
         # Clear inventory
-        self.inventory_tree.clear()
+        self.inventory_model.clear()
         self.root_folder = None
\ No newline at end of file
@@ -4,20 +4,21 @@ Handles user authentication to the Kitely grid.
 """
 
 import logging
-import threading
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-    QPushButton, QCheckBox, QComboBox, QProgressBar, QDesktopWidget
+    QPushButton, QCheckBox, QComboBox, QProgressBar
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QColor, QPalette
 from app.network.connection import GridConnection
 
+# How often the panel reads the worker's login progress
+PROGRESS_POLL_MS = 50
+
 class LoginWorker(QThread):
     """Worker thread for login operations"""
     # Define signals
     finished = pyqtSignal(bool, object)
-    progress = pyqtSignal(int, str)
     
     def __init__(self, connection, first_name, last_name, password, location):
         """Initialize login worker thread"""
@@ -28,23 +29,27 @@ class LoginWorker(QThread):
         self.password = password
         self.location = location
         
+        # Latest (percent, message), read by the panel's poll timer
+        self.progress_state = (10, "Connecting to grid...")
+        
     def run(self):
         """Run the login process"""
         try:
             # Update progress
-            self.progress.emit(30, "Authenticating...")
+            self.progress_state = (30, "Authenticating...")
             
             # Attempt login
             success, result = self.connection.login(
                 self.first_name, 
                 self.last_name, 
                 self.password, 
-                self.location
+                self.location,
+                cancel_event=self
             )
             
             if success:
                 # Update progress
-                self.progress.emit(70, "Loading world...")
+                self.progress_state = (70, "Loading world...")
             
             # Emit finished signal with result
             self.finished.emit(success, result)
@@ -52,6 +57,10 @@ class LoginWorker(QThread):
         except Exception as e:
             # Handle unexpected errors
             self.finished.emit(False, f"Error during login: {str(e)}")
+            
+    def is_set(self):
+        """Let the connection poll for cancellation like a threading.Event"""
+        return self.isInterruptionRequested()
 
 class LoginPanel(QWidget):
     """Panel for handling login to the Kitely grid"""
@@ -67,8 +76,9 @@ class LoginPanel(QWidget):
         # Store parent reference (MainWindow)
         self.main_window = parent
         
-        # Create grid connection
-        self.connection = GridConnection(self.main_window.config)
+        # Grid connection and widgets are created when first shown
+        self.connection = None
+        self._ui_built = False
         
         # Set up panel style 
         pal = self.palette()
@@ -80,14 +90,24 @@ class LoginPanel(QWidget):
         self.setMinimumSize(400, 350)
         self.setMaximumSize(450, 400)
         
-        # Create UI elements
-        self._create_ui()
-        
-        # Load grid info
-        self._load_grid_info()
-        
         self.logger.info("Login panel initialized")
         
+    def showEvent(self, event):
+        """Build the panel the first time it is shown"""
+        if not self._ui_built:
+            self._ui_built = True
+            
+            # Create grid connection
+            self.connection = GridConnection(self.main_window.config)
+            
+            # Create UI elements
+            self._create_ui()
+            
+            # Load grid info
+            self._load_grid_info()
+            
+        super(LoginPanel, self).showEvent(event)
+        
     def _create_ui(self):
         """Create UI elements"""
         # Create main layout
@@ -182,6 +202,11 @@ class LoginPanel(QWidget):
         # Set main layout
         self.setLayout(main_layout)
         
+        # Poll login progress instead of queuing a signal per step
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_POLL_MS)
+        self._progress_timer.timeout.connect(self._poll_progress)
+        
         # Connect signals
         self.login_button.clicked.connect(self.on_login)
         self.cancel_button.clicked.connect(self.on_cancel)
@@ -247,11 +272,19 @@ class LoginPanel(QWidget):
         )
         
         # Connect signals
-        self.login_worker.progress.connect(self.update_progress)
         self.login_worker.finished.connect(self.login_finished)
         
         # Start thread
         self.login_worker.start()
+        self._shown_progress = None
+        self._progress_timer.start()
+        
+    def _poll_progress(self):
+        """Show the worker's latest progress if it changed"""
+        state = self.login_worker.progress_state
+        if state != self._shown_progress:
+            self._shown_progress = state
+            self.update_progress(*state)
     
     def update_progress(self, value, message):
         """Update progress bar and status message"""
@@ -260,6 +293,8 @@ class LoginPanel(QWidget):
     
     def login_finished(self, success, result):
         """Handle login completion"""
+        self._progress_timer.stop()
+        
         if success:
             # Update progress
             self.progress.setValue(100)
@@ -289,16 +324,18 @@ class LoginPanel(QWidget):
     def on_cancel(self):
         """Handle cancel button press"""
         # Hide the login panel
-        self.main_window.login_dock.hide()
+        self.main_window.login_dialog.reject()
         
         # Clear any error message
         self.status_text.setText("")
         
         # If login is in progress, cancel it
         if not self.login_button.isEnabled() and hasattr(self, 'login_worker'):
-            # Attempt to terminate the worker thread
-            self.login_worker.terminate()
-            self.login_worker.wait()
+            # Ask the worker to stop, nobody is waiting for its result now
+            self._progress_timer.stop()
+            self.login_worker.finished.disconnect(self.login_finished)
+            self.login_worker.requestInterruption()
+            self.login_worker.wait(2000)
             
             self.login_button.setEnabled(True)
             self.cancel_button.setEnabled(True)
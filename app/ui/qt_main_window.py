@@ -3,25 +3,84 @@ Main window for the KitelyView application.
 Integrates all UI components and manages the application flow.
 """
 
+import functools
 import logging
-import os
-import sys
 from PyQt5.QtWidgets import (
-    QMainWindow, QApplication, QDesktopWidget, QDockWidget, 
-    QStatusBar, QAction, QMenu, QToolBar, QMessageBox
+    QMainWindow, QDialog, QDockWidget, QLabel, QAction, QMessageBox, QVBoxLayout
 )
-from PyQt5.QtCore import Qt, QSize, QTimer, QSettings
-from PyQt5.QtGui import QIcon, QFont, QPixmap
+from PyQt5.QtCore import Qt, QEvent, QRunnable, QThreadPool, QTimer
+from PyQt5.QtGui import QGuiApplication, QIcon
 
 from app.config import Config
-from app.ui.qt_login_panel import LoginPanel
-from app.ui.qt_world_view import WorldViewPanel
-from app.ui.qt_chat_panel import ChatPanel
-from app.ui.qt_inventory_panel import InventoryPanel
-from app.ui.qt_mini_map import MiniMapPanel
-from app.ui.qt_toolbar import ViewerToolbar
 from app.models.user import User
 
+# Menu layout: (menu title, actions), where each action is
+# (attribute, text, status tip, slot name, checkable) and None is a separator
+_MENU_SPEC = (
+    ("&File", (
+        ("login_action", "&Login", "Log in to the grid", "show_login_panel", False),
+        ("logout_action", "Log&out", "Log out from the grid", "logout", False),
+        None,
+        ("exit_action", "E&xit", "Exit the application", "close", False),
+    )),
+    ("&View", (
+        ("chat_action", "&Chat", "Show/hide chat panel", "toggle_chat_panel", True),
+        ("inventory_action", "&Inventory", "Show/hide inventory panel",
+         "toggle_inventory_panel", True),
+        ("map_action", "&Map", "Show/hide mini map", "toggle_mini_map", True),
+        None,
+        ("reset_layout_action", "&Reset Layout", "Restore the default panel layout",
+         "reset_layout", False),
+        ("fullscreen_action", "&Fullscreen", "Toggle fullscreen mode",
+         "toggle_fullscreen", True),
+    )),
+    ("&Help", (
+        ("about_action", "&About", "About KitelyView", "show_about", False),
+    )),
+)
+
+WINDOW_TITLE = "KitelyView"
+DEFAULT_WINDOW_SIZE = (1024, 768)
+
+# Dialog text
+_ABOUT_HTML = (
+    "<h3>KitelyView</h3>"
+    "<p>Version 0.1</p>"
+    "<p>A cross-platform OpenSimulator viewer for connecting to the Kitely grid.</p>"
+    "<p>Developed for educational purposes.</p>"
+)
+_CONFIRM_EXIT_TITLE = "Confirm Exit"
+_CONFIRM_EXIT_TEXT = "You are still logged in. Do you want to exit?"
+
+# Milliseconds between status bar writes for region/FPS updates
+STATUS_FLUSH_INTERVAL = 250
+
+# Application icon, rasterized once at the usual taskbar/title bar sizes
+APP_ICON_PATH = "app/assets/icons/app_icon.svg"
+APP_ICON_SIZES = (16, 32, 48, 64, 128, 256)
+
+@functools.lru_cache(maxsize=None)
+def app_icon():
+    """Return the shared application icon, building it on first use"""
+    source = QIcon(APP_ICON_PATH)
+    icon = QIcon()
+    for size in APP_ICON_SIZES:
+        icon.addPixmap(source.pixmap(size, size))
+    return icon
+
+class _DisconnectJob(QRunnable):
+    """Disconnects a grid connection off the GUI thread"""
+    
+    def __init__(self, connection):
+        super(_DisconnectJob, self).__init__()
+        self.connection = connection
+        
+    def run(self):
+        try:
+            self.connection.disconnect()
+        except Exception as e:
+            logging.getLogger("kitelyview.ui.main_window").error(f"Error disconnecting: {e}")
+
 class MainWindow(QMainWindow):
     """Main window for the KitelyView application"""
     
@@ -41,12 +100,13 @@ class MainWindow(QMainWindow):
         self.user = None
         
         # Set window properties
-        self.setWindowTitle("KitelyView")
-        self.resize(1024, 768)
+        self.setWindowTitle(WINDOW_TITLE)
+        self.resize(*DEFAULT_WINDOW_SIZE)
+        self._screen_geo = QGuiApplication.primaryScreen().availableGeometry()
         self.center_on_screen()
         
         # Set application icon
-        self.setWindowIcon(QIcon("app/assets/icons/app_icon.svg"))
+        self.setWindowIcon(app_icon())
         
         # Initialize UI components
         self._create_ui()
@@ -58,172 +118,188 @@ class MainWindow(QMainWindow):
         
     def _create_ui(self):
         """Create the UI components"""
+        # Panel modules pull in OpenGL, networking and friends; import them
+        # here so the module itself stays cheap to load
+        from app.ui.qt_login_panel import LoginPanel
+        from app.ui.qt_world_view import WorldViewPanel
+        from app.ui.qt_toolbar import ViewerToolbar
+        
         # Create central widget (3D view)
         self.world_view = WorldViewPanel(self)
         self.setCentralWidget(self.world_view)
         
         # Create status bar
         self.status_bar = self.statusBar()
-        self.status_message = QStatusBar.insertPermanentWidget(self.status_bar, 0)
-        self.region_info = QStatusBar.insertPermanentWidget(self.status_bar, 1)
-        self.fps_display = QStatusBar.insertPermanentWidget(self.status_bar, 2)
-        
-        # Create login panel
-        self.login_dock = QDockWidget("Login", self)
-        self.login_dock.setAllowedAreas(Qt.NoDockWidgetArea)
-        self.login_dock.setFeatures(QDockWidget.NoDockWidgetFeatures)
+        self.status_message = QLabel()
+        self.region_info = QLabel()
+        self.fps_display = QLabel()
+        self.status_bar.addWidget(self.status_message, 1)
+        self.status_bar.addPermanentWidget(self.region_info)
+        self.status_bar.addPermanentWidget(self.fps_display)
+        self._status_labels = {
+            0: self.status_message,
+            1: self.region_info,
+            2: self.fps_display,
+        }
+        
+        # Region and FPS text is coalesced and written a few times a second
+        self._pending_status = {}
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(STATUS_FLUSH_INTERVAL)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+        # Create login panel in a plain dialog, centered over the window
+        self.login_dialog = QDialog(self)
+        self.login_dialog.setWindowTitle("Login")
         self.login_panel = LoginPanel(self)
-        self.login_dock.setWidget(self.login_panel)
+        login_layout = QVBoxLayout(self.login_dialog)
+        login_layout.setContentsMargins(0, 0, 0, 0)
+        login_layout.addWidget(self.login_panel)
+        
+        # Session panels are built on first use by _ensure_session_panels
+        self.chat_dock = self.chat_panel = None
+        self.inventory_dock = self.inventory_panel = None
+        self.mini_map_dock = self.mini_map_panel = None
+        self._session_docks = ()
+        self._refreshables = ()
+        
+        # Create toolbar
+        self.toolbar = ViewerToolbar(self)
+        self.toolbar.setObjectName("viewer_toolbar")
+        self.addToolBar(self.toolbar)
+        self.toolbar.hide()  # Initially hidden until login
+        
+        # Create menus
+        self._create_menus()
+        
+        # Show login panel
+        self.login_dialog.show()
+        
+        # Snapshot the default layout so a reset is a single restoreState
+        self._default_state = self.saveState()
+        
+    def _ensure_session_panels(self):
+        """Create the chat, inventory and mini map docks on first use"""
+        if self.chat_dock is not None:
+            return
+            
+        from app.ui.qt_chat_panel import ChatPanel
+        from app.ui.qt_inventory_panel import InventoryPanel
+        from app.ui.qt_mini_map import MiniMapPanel
         
         # Create chat panel
         self.chat_dock = QDockWidget("Chat", self)
+        self.chat_dock.setObjectName("chat_dock")
         self.chat_dock.setAllowedAreas(Qt.BottomDockWidgetArea)
         self.chat_panel = ChatPanel(self)
         self.chat_dock.setWidget(self.chat_panel)
         self.addDockWidget(Qt.BottomDockWidgetArea, self.chat_dock)
-        self.chat_dock.hide()  # Initially hidden until login
+        self.chat_dock.hide()
         
         # Create inventory panel
         self.inventory_dock = QDockWidget("Inventory", self)
+        self.inventory_dock.setObjectName("inventory_dock")
         self.inventory_dock.setAllowedAreas(Qt.RightDockWidgetArea)
         self.inventory_panel = InventoryPanel(self)
         self.inventory_dock.setWidget(self.inventory_panel)
         self.addDockWidget(Qt.RightDockWidgetArea, self.inventory_dock)
-        self.inventory_dock.hide()  # Initially hidden until login
+        self.inventory_dock.hide()
         
         # Create mini map panel
         self.mini_map_dock = QDockWidget("Mini Map", self)
+        self.mini_map_dock.setObjectName("mini_map_dock")
         self.mini_map_dock.setAllowedAreas(Qt.RightDockWidgetArea)
         self.mini_map_panel = MiniMapPanel(self)
+        # The map widget covers the whole panel, skip the background fill
+        self.mini_map_panel.setAttribute(Qt.WA_NoSystemBackground)
         self.mini_map_dock.setWidget(self.mini_map_panel)
         self.addDockWidget(Qt.RightDockWidgetArea, self.mini_map_dock)
-        self.mini_map_dock.hide()  # Initially hidden until login
+        self.mini_map_dock.hide()
         
-        # Create toolbar
-        self.toolbar = ViewerToolbar(self)
-        self.addToolBar(self.toolbar)
-        self.toolbar.hide()  # Initially hidden until login
+        # Panels with periodic refresh work, paused while their dock is hidden
+        self._refreshables = (
+            (self.chat_dock, self.chat_panel),
+            (self.mini_map_dock, self.mini_map_panel),
+        )
+        for dock, panel in self._refreshables:
+            dock.visibilityChanged.connect(functools.partial(self._on_dock_visibility, panel))
+            panel.pause_refresh()  # Docks start hidden
         
-        # Create menus
-        self._create_menus()
+        self._session_docks = (self.chat_dock, self.inventory_dock, self.mini_map_dock)
         
-        # Show login panel
-        self.login_dock.setFloating(True)
-        self.login_dock.show()
+        # Fold the new docks into the layout that reset_layout restores
+        self._default_state = self.saveState()
         
     def _create_menus(self):
-        """Create application menus"""
-        # File menu
-        file_menu = self.menuBar().addMenu("&File")
-        
-        login_action = QAction("&Login", self)
-        login_action.setStatusTip("Log in to the grid")
-        login_action.triggered.connect(self.show_login_panel)
-        file_menu.addAction(login_action)
-        
-        logout_action = QAction("Log&out", self)
-        logout_action.setStatusTip("Log out from the grid")
-        logout_action.triggered.connect(self.logout)
-        logout_action.setEnabled(False)
-        self.logout_action = logout_action
-        file_menu.addAction(logout_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("E&xit", self)
-        exit_action.setStatusTip("Exit the application")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # View menu
-        view_menu = self.menuBar().addMenu("&View")
-        
-        chat_action = QAction("&Chat", self)
-        chat_action.setStatusTip("Show/hide chat panel")
-        chat_action.setCheckable(True)
-        chat_action.setChecked(False)
-        chat_action.triggered.connect(self.toggle_chat_panel)
-        self.chat_action = chat_action
-        view_menu.addAction(chat_action)
-        
-        inventory_action = QAction("&Inventory", self)
-        inventory_action.setStatusTip("Show/hide inventory panel")
-        inventory_action.setCheckable(True)
-        inventory_action.setChecked(False)
-        inventory_action.triggered.connect(self.toggle_inventory_panel)
-        self.inventory_action = inventory_action
-        view_menu.addAction(inventory_action)
-        
-        map_action = QAction("&Map", self)
-        map_action.setStatusTip("Show/hide mini map")
-        map_action.setCheckable(True)
-        map_action.setChecked(False)
-        map_action.triggered.connect(self.toggle_mini_map)
-        self.map_action = map_action
-        view_menu.addAction(map_action)
-        
-        view_menu.addSeparator()
-        
-        fullscreen_action = QAction("&Fullscreen", self)
-        fullscreen_action.setStatusTip("Toggle fullscreen mode")
-        fullscreen_action.setCheckable(True)
-        fullscreen_action.setChecked(False)
-        fullscreen_action.triggered.connect(self.toggle_fullscreen)
-        view_menu.addAction(fullscreen_action)
-        
-        # Help menu
-        help_menu = self.menuBar().addMenu("&Help")
-        
-        about_action = QAction("&About", self)
-        about_action.setStatusTip("About KitelyView")
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        """Create application menus from _MENU_SPEC"""
+        menu_bar = self.menuBar()
+        for title, actions in _MENU_SPEC:
+            menu = menu_bar.addMenu(title)
+            group = []
+            for spec in actions:
+                if spec is None:
+                    # Add each run of actions in one call, then the separator
+                    menu.addActions(group)
+                    menu.addSeparator()
+                    group = []
+                    continue
+                attr, text, tip, slot, checkable = spec
+                action = QAction(text, self)
+                action.setStatusTip(tip)
+                action.setCheckable(checkable)
+                action.triggered.connect(getattr(self, slot), Qt.UniqueConnection)
+                setattr(self, attr, action)
+                group.append(action)
+            menu.addActions(group)
+                
+        # Nothing to log out of until a login succeeds
+        self.logout_action.setEnabled(False)
         
     def center_on_screen(self):
         """Center the window on the screen"""
         frame_geometry = self.frameGeometry()
-        screen_center = QDesktopWidget().availableGeometry().center()
+        screen_center = self._screen_geo.center()
         frame_geometry.moveCenter(screen_center)
         self.move(frame_geometry.topLeft())
         
     def login_success(self, user_data):
         """Handle successful login"""
-        self.logger.info(f"Login successful for user: {user_data['name']}")
-        
         # Set logged in state
         self.is_logged_in = True
         
         # Create user object
         self.user = User(user_data['id'], user_data['name'])
+        name = self.user.full_name
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Login successful for user: {name}")
         
         # Update window title
-        self.setWindowTitle(f"KitelyView - {user_data['name']}")
+        self.setWindowTitle(f"{WINDOW_TITLE} - {name}")
         
-        # Hide login panel
-        self.login_dock.hide()
+        # Close login panel
+        self.login_dialog.accept()
         
         # Update UI
         self.logout_action.setEnabled(True)
-        self.toolbar.show()
+        self._ensure_session_panels()
+        self._set_session_visible(True)
         
-        # Show panels
-        self.chat_dock.show()
-        self.inventory_dock.show()
-        self.mini_map_dock.show()
-        self.chat_action.setChecked(True)
-        self.inventory_action.setChecked(True)
-        self.map_action.setChecked(True)
-        
-        # Notify components
-        self.world_view.on_login_success()
-        self.chat_panel.on_login_success()
-        self.inventory_panel.on_login_success()
-        self.mini_map_panel.on_login_success()
+        # Notify components on later event-loop passes so the window can
+        # repaint between them instead of stalling until all are done
+        for component in (self.world_view, self.chat_panel,
+                          self.inventory_panel, self.mini_map_panel):
+            QTimer.singleShot(0, functools.partial(self._notify_login_success, component))
         
         # Update status bar
-        self.update_status(f"Logged in as {user_data['name']}", 0)
+        self.update_status(f"Logged in as {name}", 0)
         self.update_status(f"Region: {user_data['current_region']}", 1)
         
+    def _notify_login_success(self, component):
+        """Deliver a deferred login notification unless we logged out meanwhile"""
+        if self.is_logged_in:
+            component.on_login_success()
+            
     def logout(self):
         """Log out from the grid"""
         if not self.is_logged_in:
@@ -236,19 +312,11 @@ class MainWindow(QMainWindow):
         self.user = None
         
         # Reset window title
-        self.setWindowTitle("KitelyView")
+        self.setWindowTitle(WINDOW_TITLE)
         
         # Update UI
         self.logout_action.setEnabled(False)
-        self.toolbar.hide()
-        
-        # Hide panels
-        self.chat_dock.hide()
-        self.inventory_dock.hide()
-        self.mini_map_dock.hide()
-        self.chat_action.setChecked(False)
-        self.inventory_action.setChecked(False)
-        self.map_action.setChecked(False)
+        self._set_session_visible(False)
         
         # Notify components
         self.world_view.on_logout()
@@ -257,26 +325,60 @@ class MainWindow(QMainWindow):
         self.mini_map_panel.on_logout()
         
         # Show login panel
-        self.login_dock.show()
+        self.login_dialog.show()
         
         # Update status bar
         self.update_status("Logged out", 0)
         self.update_status("", 1)
         
+    def _set_session_visible(self, visible):
+        """Show or hide the toolbar and session panels together"""
+        # Hold repaints so the four visibility changes cost one relayout
+        self.setUpdatesEnabled(False)
+        self.world_view.setUpdatesEnabled(False)
+        try:
+            self.toolbar.setVisible(visible)
+            for dock in self._session_docks:
+                dock.setVisible(visible)
+        finally:
+            self.world_view.setUpdatesEnabled(True)
+            self.setUpdatesEnabled(True)
+            self.update()
+        self.chat_action.setChecked(visible)
+        self.inventory_action.setChecked(visible)
+        self.map_action.setChecked(visible)
+        
+    def reset_layout(self):
+        """Restore the default dock layout"""
+        self.restoreState(self._default_state)
+        
+        # The snapshot was taken logged out; reapply the session visibility
+        self._set_session_visible(self.is_logged_in)
+        
+    def _on_dock_visibility(self, panel, visible):
+        """Pause or resume a panel's refresh to follow its dock"""
+        if visible:
+            panel.resume_refresh()
+        else:
+            panel.pause_refresh()
+            
     def show_login_panel(self):
         """Show the login panel"""
-        self.login_dock.show()
+        self.login_dialog.show()
         
     def toggle_chat_panel(self, checked):
         """Toggle chat panel visibility"""
+        self._ensure_session_panels()
         self.chat_dock.setVisible(checked)
         
     def toggle_inventory_panel(self, checked):
         """Toggle inventory panel visibility"""
+        self._ensure_session_panels()
         self.inventory_dock.setVisible(checked)
         
     def toggle_mini_map(self, checked):
         """Toggle mini map visibility"""
+        self._ensure_session_panels()
         self.mini_map_dock.setVisible(checked)
         
     def toggle_fullscreen(self, checked):
@@ -289,22 +391,51 @@ class MainWindow(QMainWindow):
     def update_status(self, message, position=0):
         """Update status bar message"""
         if position == 0:
-            self.statusBar().showMessage(message)
-        elif position == 1:
-            self.region_info.setText(message)
-        elif position == 2:
-            self.fps_display.setText(message)
+            self._status_labels[0].setText(message)
+        elif position in (1, 2):
+            self._pending_status[position] = message
+            if not self._status_timer.isActive():
+                self._status_timer.start()
+                
+    def _flush_status(self):
+        """Write coalesced region/FPS text to the labels that changed"""
+        labels = self._status_labels
+        for position, message in self._pending_status.items():
+            label = labels[position]
+            if label.text() != message:
+                label.setText(message)
+        self._pending_status.clear()
             
+    def _update_render_rate(self):
+        """Match the world view frame rate to the window state"""
+        from app.ui.qt_world_view import FRAME_INTERVAL, BACKGROUND_FRAME_INTERVAL
+        
+        if self.isMinimized() or not self.isVisible():
+            self.world_view.pause_rendering()
+        elif self.isActiveWindow():
+            self.world_view.resume_rendering(FRAME_INTERVAL)
+        else:
+            self.world_view.resume_rendering(BACKGROUND_FRAME_INTERVAL)
+            
+    def changeEvent(self, event):
+        """Pause rendering when minimized and throttle it when unfocused"""
+        super(MainWindow, self).changeEvent(event)
+        if event.type() in (QEvent.WindowStateChange, QEvent.ActivationChange):
+            self._update_render_rate()
+            
+    def showEvent(self, event):
+        """Resume rendering when the window is shown"""
+        super(MainWindow, self).showEvent(event)
+        self._update_render_rate()
+        
+    def hideEvent(self, event):
+        """Stop rendering while the window is hidden"""
+        super(MainWindow, self).hideEvent(event)
+        self.world_view.pause_rendering()
+        
     def show_about(self):
         """Show about dialog"""
-        QMessageBox.about(
-            self, 
-            "About KitelyView",
-            "<h3>KitelyView</h3>"
-            "<p>Version 0.1</p>"
-            "<p>A cross-platform OpenSimulator viewer for connecting to the Kitely grid.</p>"
-            "<p>Developed for educational purposes.</p>"
-        )
+        QMessageBox.about(self, "About KitelyView", _ABOUT_HTML)
         
     def closeEvent(self, event):
         """Handle window close event"""
@@ -312,15 +443,19 @@ class MainWindow(QMainWindow):
             # Ask if the user wants to log out
             reply = QMessageBox.question(
                 self, 
-                "Confirm Exit",
-                "You are still logged in. Do you want to exit?",
+                _CONFIRM_EXIT_TITLE,
+                _CONFIRM_EXIT_TEXT,
                 QMessageBox.Yes | QMessageBox.No, 
                 QMessageBox.No
             )
             
             if reply == QMessageBox.Yes:
-                # Log out and accept the close event
+                # Log out, leave the network teardown to a pool thread and
+                # close right away
                 self.logout()
+                connection = self.login_panel.connection
+                if connection is not None and connection.logged_in:
+                    QThreadPool.globalInstance().start(_DisconnectJob(connection))
                 event.accept()
             else:
                 # Reject the close event
@@ -5,9 +5,23 @@ Displays a top-down view of the current region.
 
 import logging
 import math
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PyQt5.QtCore import Qt, QTimer, QRect, QPoint
-from PyQt5.QtGui import QPainter, QBrush, QPen, QColor, QFont, QPixmap
+import numpy as np
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from PyQt5.QtCore import Qt, QTimer, QRect, QPoint, QPointF
+from PyQt5.QtGui import QPainter, QBrush, QPen, QColor, QFont, QImage, QPolygonF
+
+# Placeholder terrain: height band upper bounds and the RGB colour per band
+# (water, beach, land, mountains)
+TERRAIN_BANDS = (0.3, 0.4, 0.7)
+TERRAIN_PALETTE = np.array([
+    (50, 100, 200),
+    (240, 240, 150),
+    (30, 180, 30),
+    (150, 100, 70),
+], dtype=np.uint8)
+
+# Player arrow outline: tip, bottom left, bottom middle, bottom right
+ARROW_POINTS = ((0, -5), (-3, 3), (0, 1), (3, 3))
 
 class MiniMapPanel(QWidget):
     """Panel for displaying a mini map of the region"""
@@ -44,9 +58,19 @@ class MiniMapPanel(QWidget):
         
     def update_map(self):
         """Update map display"""
-        if self.isVisible():
+        # Mutators already request a repaint; only catch up on one still pending
+        if self.isVisible() and self.map_widget._dirty:
             self.map_widget.update()
             
+    def pause_refresh(self):
+        """Stop periodic map updates while the panel is hidden"""
+        self.update_timer.stop()
+        
+    def resume_refresh(self):
+        """Restart periodic map updates once the panel is shown again"""
+        if self.main_window.is_logged_in and not self.update_timer.isActive():
+            self.update_timer.start(1000)
+            
     def on_login_success(self):
         """Handle successful login"""
         # Start updating the map
@@ -63,6 +87,35 @@ class MiniMapPanel(QWidget):
         self.map_widget.clear()
 
 
+class _PointBuffer:
+    """Growable array of map positions, with a name per position"""
+    
+    def __init__(self):
+        self.xy = np.empty((16, 2), dtype=np.float32)
+        self.names = []
+        
+    def __len__(self):
+        return len(self.names)
+        
+    def append(self, x, y, name=None):
+        """Add a position, doubling the array when it is full"""
+        count = len(self.names)
+        if count == len(self.xy):
+            grown = np.empty((count * 2, 2), dtype=np.float32)
+            grown[:count] = self.xy
+            self.xy = grown
+        self.xy[count] = (x, y)
+        self.names.append(name)
+        
+    def clear(self):
+        """Remove all positions, keeping the allocated array"""
+        self.names = []
+        
+    def scaled(self, scale):
+        """Return all positions scaled to integer widget coordinates"""
+        return (self.xy[:len(self.names)] * scale).astype(np.int32).tolist()
+
+
 class MapWidget(QWidget):
     """Widget for rendering the map"""
     
@@ -76,6 +129,12 @@ class MapWidget(QWidget):
         # Set attributes
         self.setMinimumSize(200, 200)
         
+        # Every paint covers the widget with the cached frame, so Qt need
+        # not erase the background first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
+        
         # Map state
         self.region_name = "Unknown Region"
         self.region_size = 256  # Standard OpenSim region size
@@ -87,14 +146,37 @@ class MapWidget(QWidget):
         self.terrain_heightmap = None
         
         # Avatar positions (other than player)
-        self.avatars = []
+        self.avatars = _PointBuffer()
         
         # Object positions
-        self.objects = []
+        self.objects = _PointBuffer()
         
         # Map is initially clear
         self.is_clear = True
         
+        # Drawing tools, created once and reused by every render
+        self._background = QColor(200, 230, 255)
+        self._border_pen = QPen(Qt.black, 2)
+        self._object_brush = QBrush(QColor(150, 150, 150))
+        self._avatar_brush = QBrush(QColor(0, 200, 0))
+        self._player_brush = QBrush(QColor(200, 0, 0))
+        self._message_font = QFont(self.font())
+        self._message_font.setPointSize(10)
+        self._label_font = QFont(self.font())
+        self._label_font.setPointSize(8)
+        
+        # Player arrow polygons by whole-degree rotation
+        self._arrow_cache = {}
+        
+        # Last rendered frame, redrawn only after a change marks it dirty
+        self._cached_frame = None
+        self._dirty = True
+        
+        # Rendered terrain, rebuilt when the map size or region changes
+        self._terrain_buffer = None
+        self._terrain_image = None
+        self._terrain_key = None
+        
     def clear(self):
         """Clear the map data"""
         self.region_name = "Unknown Region"
@@ -102,9 +184,11 @@ class MapWidget(QWidget):
         self.player_y = self.region_size / 2
         self.player_rotation = 0
         self.terrain_heightmap = None
-        self.avatars = []
-        self.objects = []
+        self.avatars.clear()
+        self.objects.clear()
         self.is_clear = True
+        self._terrain_key = None
+        self._dirty = True
         self.update()
         
     def set_position(self, x, y, rotation=None):
@@ -118,18 +202,21 @@ class MapWidget(QWidget):
         self.is_clear = False
         
         # Update display
+        self._dirty = True
         self.update()
         
     def add_avatar(self, x, y, name):
         """Add avatar to the map"""
-        self.avatars.append((x, y, name))
+        self.avatars.append(x, y, name)
         self.is_clear = False
+        self._dirty = True
         self.update()
         
     def add_object(self, x, y, name=None):
         """Add object to the map"""
-        self.objects.append((x, y, name))
+        self.objects.append(x, y, name)
         self.is_clear = False
+        self._dirty = True
         self.update()
         
     def set_region(self, name, size=256):
@@ -137,26 +224,81 @@ class MapWidget(QWidget):
         self.region_name = name
         self.region_size = size
         self.is_clear = False
+        self._terrain_key = None
+        self._dirty = True
         self.update()
         
+    def _terrain(self, size):
+        """Return the placeholder terrain as an image of size x size"""
+        key = (size, self.region_size, id(self.terrain_heightmap))
+        if self._terrain_key == key:
+            return self._terrain_image
+        size = max(size, 1)
+        
+        # Height per 4x4 cell, banded into water/beach/land/mountains
+        cells = np.arange(0, size, 4) / size
+        height = np.sin(cells[None, :] * 4) * np.cos(cells[:, None] * 4) * 0.5 + 0.5
+        rgb = TERRAIN_PALETTE[np.digitize(height, TERRAIN_BANDS)]
+        
+        # Expand each cell to 4x4 pixels; the QImage reads this buffer in
+        # place, so it is kept alive alongside the image
+        rgb = np.repeat(np.repeat(rgb, 4, axis=0), 4, axis=1)[:size, :size]
+        self._terrain_buffer = np.ascontiguousarray(rgb)
+        self._terrain_image = QImage(
+            self._terrain_buffer.data, size, size, 3 * size, QImage.Format_RGB888
+        )
+        self._terrain_key = key
+        return self._terrain_image
+        
+    def _arrow(self, rotation):
+        """Return the player arrow rotated by the given angle in degrees"""
+        key = int(rotation) % 360
+        polygon = self._arrow_cache.get(key)
+        if polygon is None:
+            angle = math.radians(key)
+            cos_a = math.cos(angle)
+            sin_a = math.sin(angle)
+            polygon = QPolygonF([
+                QPointF(x * cos_a - y * sin_a, x * sin_a + y * cos_a)
+                for x, y in ARROW_POINTS
+            ])
+            self._arrow_cache[key] = polygon
+        return polygon
+        
     def paintEvent(self, event):
         """Handle paint event"""
+        # Re-render the frame only when map data or the widget size changed
+        frame = self._cached_frame
+        if self._dirty or frame is None or frame.size() != self.size():
+            frame = QImage(self.size(), QImage.Format_RGB32)
+            frame_painter = QPainter(frame)
+            self._render(frame_painter)
+            frame_painter.end()
+            self._cached_frame = frame
+            self._dirty = False
+            
+        # Copy only the exposed part of the frame
+        rect = event.rect()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.drawImage(rect, frame, rect)
+        
+    def _render(self, painter):
+        """Draw the full map with the given painter"""
+        # Rects are axis-aligned; antialiasing is only enabled for the
+        # avatar ellipses and the player arrow below
+        painter.setRenderHint(QPainter.Antialiasing, False)
         
         # Get widget size
         width = self.width()
         height = self.height()
         
         # Draw background
-        painter.fillRect(0, 0, width, height, QColor(200, 230, 255))
+        painter.fillRect(0, 0, width, height, self._background)
         
         if self.is_clear:
             # Draw "No Map Data" message
             painter.setPen(Qt.black)
-            font = painter.font()
-            font.setPointSize(10)
-            painter.setFont(font)
+            painter.setFont(self._message_font)
             painter.drawText(
                 QRect(0, 0, width, height),
                 Qt.AlignCenter,
@@ -168,7 +310,7 @@ class MapWidget(QWidget):
         scale = min(width, height) / self.region_size
         
         # Draw region border
-        painter.setPen(QPen(Qt.black, 2))
+        painter.setPen(self._border_pen)
         painter.setBrush(Qt.NoBrush)
         painter.drawRect(
             0, 
@@ -179,89 +321,40 @@ class MapWidget(QWidget):
         
         # Draw terrain heightmap (simplified as a gradient)
         if self.terrain_heightmap is None:
-            # No real terrain data, just draw a gradient
-            for y in range(0, int(self.region_size * scale), 4):
-                for x in range(0, int(self.region_size * scale), 4):
-                    # Calculate a simple height value based on position
-                    rel_x = x / (self.region_size * scale)
-                    rel_y = y / (self.region_size * scale)
-                    height = math.sin(rel_x * 4) * math.cos(rel_y * 4) * 0.5 + 0.5
-                    
-                    # Set color based on height
-                    if height < 0.3:  # Water
-                        color = QColor(50, 100, 200)
-                    elif height < 0.4:  # Beach
-                        color = QColor(240, 240, 150)
-                    elif height < 0.7:  # Land
-                        color = QColor(30, 180, 30)
-                    else:  # Mountains
-                        color = QColor(150, 100, 70)
-                        
-                    painter.fillRect(
-                        x, 
-                        y, 
-                        4, 
-                        4, 
-                        color
-                    )
+            painter.drawImage(0, 0, self._terrain(int(self.region_size * scale)))
         
         # Draw objects
         painter.setPen(Qt.black)
-        painter.setBrush(QBrush(QColor(150, 150, 150)))
-        for x, y, name in self.objects:
-            painter.drawRect(
-                int(x * scale - 2),
-                int(y * scale - 2),
-                4,
-                4
-            )
+        painter.setBrush(self._object_brush)
+        for x, y in self.objects.scaled(scale):
+            painter.drawRect(x - 2, y - 2, 4, 4)
         
         # Draw other avatars
+        painter.setRenderHint(QPainter.Antialiasing, True)
         painter.setPen(Qt.black)
-        painter.setBrush(QBrush(QColor(0, 200, 0)))
-        for x, y, name in self.avatars:
-            painter.drawEllipse(
-                QPoint(int(x * scale), int(y * scale)),
-                3,
-                3
-            )
+        painter.setBrush(self._avatar_brush)
+        for (x, y), name in zip(self.avatars.scaled(scale), self.avatars.names):
+            painter.drawEllipse(QPoint(x, y), 3, 3)
             
             # Draw name if provided
             if name:
-                painter.drawText(
-                    int(x * scale + 5),
-                    int(y * scale + 3),
-                    name
-                )
+                painter.drawText(x + 5, y + 3, name)
         
         # Draw player avatar
         painter.setPen(Qt.black)
-        painter.setBrush(QBrush(QColor(200, 0, 0)))
-        
-        # Save current state
-        painter.save()
-        
-        # Translate to player position and rotate
-        painter.translate(int(self.player_x * scale), int(self.player_y * scale))
-        painter.rotate(self.player_rotation)
-        
-        # Draw player arrow
-        points = [
-            QPoint(0, -5),    # Tip
-            QPoint(-3, 3),    # Bottom left
-            QPoint(0, 1),     # Bottom middle
-            QPoint(3, 3)      # Bottom right
-        ]
-        painter.drawPolygon(points)
+        painter.setBrush(self._player_brush)
         
-        # Restore painter state
-        painter.restore()
+        # Draw player arrow, pre-rotated, at the player position
+        player_x = int(self.player_x * scale)
+        player_y = int(self.player_y * scale)
+        painter.translate(player_x, player_y)
+        painter.drawPolygon(self._arrow(self.player_rotation))
+        painter.translate(-player_x, -player_y)
+        painter.setRenderHint(QPainter.Antialiasing, False)
         
         # Draw region name
         painter.setPen(Qt.black)
-        font = painter.font()
-        font.setPointSize(8)
-        painter.setFont(font)
+        painter.setFont(self._label_font)
         painter.drawText(
             5,
             height - 5,
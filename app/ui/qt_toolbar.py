@@ -6,7 +6,6 @@ Provides quick access to common actions.
 import logging
 from PyQt5.QtWidgets import QToolBar, QAction, QComboBox, QLabel
 from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui import QIcon
 
 class ViewerToolbar(QToolBar):
     """Toolbar for the viewer application"""
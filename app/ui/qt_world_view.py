@@ -4,17 +4,34 @@ World view panel for rendering the 3D OpenSimulator world using PyQt5.
 
 import logging
 import time
-import math
-import numpy as np
 from PyQt5.QtWidgets import QOpenGLWidget
-from PyQt5.QtCore import Qt, QTimer
-from OpenGL.GL import *
-from OpenGL.GLU import *
+from PyQt5.QtCore import Qt, QPoint, QTimer
+from PyQt5.QtGui import QCursor, QSurfaceFormat
+
+# PyOpenGL reads these flags when OpenGL.GL is first imported, and they
+# apply to every GL call in the process (including app.renderer). Turning
+# off the glGetError check after each call removes most of the per-call
+# Python overhead; errors are no longer raised as GLError exceptions.
+import OpenGL
+OpenGL.ERROR_CHECKING = False
+OpenGL.ERROR_LOGGING = False
+from OpenGL.GL import (
+    glBlendFunc, glClear, glClearColor, glDepthFunc, glEnable, glViewport,
+    GL_BLEND, GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, GL_DEPTH_TEST,
+    GL_LEQUAL, GL_ONE_MINUS_SRC_ALPHA, GL_SRC_ALPHA
+)
 
 from app.renderer.camera import Camera
 from app.renderer.scene import Scene
 from app.utils.vector import Vector3
-from app.utils.matrix import Matrix4
+
+# Render timer intervals (ms) for the focused and unfocused window
+FRAME_INTERVAL = 16
+BACKGROUND_FRAME_INTERVAL = 100
+
+# Longest step (s) applied to camera movement in one tick, so a stall or
+# a paused timer does not turn into a jump
+MAX_FRAME_DT = 0.1
 
 class WorldViewPanel(QOpenGLWidget):
     """Panel for rendering the 3D world"""
@@ -24,6 +41,18 @@ class WorldViewPanel(QOpenGLWidget):
         # Initialize OpenGL widget
         super(WorldViewPanel, self).__init__(parent)
         
+        # Request a vsynced, 4x multisampled surface with a depth buffer up
+        # front; multisampling is then on without a glEnable in initializeGL
+        surface_format = QSurfaceFormat()
+        surface_format.setSwapInterval(1)
+        surface_format.setSamples(4)
+        surface_format.setDepthBufferSize(24)
+        self.setFormat(surface_format)
+        
+        # paintGL clears and redraws everything, so Qt need not invalidate
+        # the framebuffer before each frame
+        self.setUpdateBehavior(QOpenGLWidget.PartialUpdate)
+        
         # Set up logging
         self.logger = logging.getLogger("kitelyview.ui.world_view")
         self.logger.info("Initializing world view panel")
@@ -61,7 +90,11 @@ class WorldViewPanel(QOpenGLWidget):
         # Set up animation timer (60 FPS)
         self.timer = QTimer()
         self.timer.timeout.connect(self.on_timer)
-        self.timer.start(16)  # ~60 FPS
+        self.timer.start(FRAME_INTERVAL)  # ~60 FPS
+        self._last_tick = time.perf_counter()
+        
+        # Set when the view needs a redraw; ticks with nothing to do skip it
+        self._dirty = True
         
         # Display simple starter world until login
         self.is_logged_in = False
@@ -79,9 +112,6 @@ class WorldViewPanel(QOpenGLWidget):
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         
-        # Anti-aliasing
-        glEnable(GL_MULTISAMPLE)
-        
         # Initialize shaders and resources
         self.scene.initialize()
         
@@ -93,6 +123,8 @@ class WorldViewPanel(QOpenGLWidget):
     
     def resizeGL(self, width, height):
         """Handle resize event (called by Qt)"""
+        self._dirty = True
+        
         # Update viewport
         glViewport(0, 0, width, height)
         
@@ -120,23 +152,46 @@ class WorldViewPanel(QOpenGLWidget):
             self.frame_count = 0
             self.last_time = current_time
     
+    def pause_rendering(self):
+        """Stop the render timer, e.g. while the window is minimized"""
+        self.timer.stop()
+        
+    def resume_rendering(self, interval=FRAME_INTERVAL):
+        """Run the render timer at the given interval"""
+        if not self.timer.isActive():
+            self._last_tick = time.perf_counter()
+            self.timer.start(interval)
+        elif self.timer.interval() != interval:
+            self.timer.start(interval)
+    
     def on_timer(self):
         """Handle timer event for animation"""
+        # Advance by the real time since the last tick
+        now = time.perf_counter()
+        dt = min(now - self._last_tick, MAX_FRAME_DT)
+        self._last_tick = now
+        
+        # Held movement keys keep the view changing every tick
+        moving = (self.move_forward or self.move_backward or self.move_left or
+                  self.move_right or self.move_up or self.move_down)
+        if not (moving or self._dirty):
+            return
+        self._dirty = False
+        
         # Process camera movement
-        self.process_camera_movement()
+        self.process_camera_movement(dt)
         
         # Trigger a redraw
         self.update()
     
-    def process_camera_movement(self):
-        """Process camera movement from keyboard input"""
+    def process_camera_movement(self, dt):
+        """Process camera movement from keyboard input over dt seconds"""
         # Skip if not logged in
         if not self.is_logged_in:
             return
             
         # Movement speed (units per second)
         speed = 5.0
-        dt = 0.016  # Assume 16ms between frames
         
         # Apply movement
         if self.move_forward:
@@ -169,6 +224,11 @@ class WorldViewPanel(QOpenGLWidget):
             self.last_mouse_y = event.y()
             self.setCursor(Qt.BlankCursor)  # Hide cursor for better control
             self.grabMouse()  # Capture mouse to track outside widget
+            
+        # The window cannot move during a drag, so resolve the recenter
+        # target once per press instead of on every motion event
+        self._center = QPoint(self.width() // 2, self.height() // 2)
+        self._global_center = self.mapToGlobal(self._center)
     
     def mouseReleaseEvent(self, event):
         """Handle mouse button release events"""
@@ -200,9 +260,11 @@ class WorldViewPanel(QOpenGLWidget):
                 # Left drag - rotate camera
                 self.camera.yaw(-dx * 0.5)
                 self.camera.pitch(-dy * 0.5)
+                self._dirty = True
             elif self.right_mouse_down:
                 # Right drag - pan camera
                 self.camera.pan(-dx * 0.1, dy * 0.1)
+                self._dirty = True
         
         # Store current position
         self.last_mouse_x = x
@@ -210,10 +272,10 @@ class WorldViewPanel(QOpenGLWidget):
         
         # Reset cursor to center if mouse buttons are down (for continuous rotation/pan)
         if self.mouse_down or self.right_mouse_down:
-            center_x = self.width() // 2
-            center_y = self.height() // 2
+            center_x = self._center.x()
+            center_y = self._center.y()
             if abs(x - center_x) > 100 or abs(y - center_y) > 100:
-                self.cursor().setPos(self.mapToGlobal(Qt.QPoint(center_x, center_y)))
+                QCursor.setPos(self._global_center)
                 self.last_mouse_x = center_x
                 self.last_mouse_y = center_y
     
@@ -226,6 +288,7 @@ class WorldViewPanel(QOpenGLWidget):
             # Zoom in/out
             zoom_factor = delta / 120.0  # 120 is the typical delta for one scroll unit
             self.camera.zoom(zoom_factor)
+            self._dirty = True
     
     def keyPressEvent(self, event):
         """Handle key press events"""
@@ -233,6 +296,7 @@ class WorldViewPanel(QOpenGLWidget):
         if not self.is_logged_in:
             event.accept()
             return
+        self._dirty = True
             
         # Handle movement keys
         key = event.key()
@@ -259,6 +323,7 @@ class WorldViewPanel(QOpenGLWidget):
         if not self.is_logged_in:
             event.accept()
             return
+        self._dirty = True
             
         # Handle movement keys
         key = event.key()
@@ -289,10 +354,12 @@ class WorldViewPanel(QOpenGLWidget):
         # Reset camera position
         self.camera.set_position(Vector3(128, 20, 128))
         self.camera.look_at(Vector3(128, 10, 128))
+        self._dirty = True
         
     def on_logout(self):
         """Handle logout"""
         self.is_logged_in = False
         
         # Reset scene to simple starter world
-        self.scene.reset()
\ No newline at end of file
+        self.scene.reset()
+        self._dirty = True
\ No newline at end of file
@@ -109,6 +109,8 @@ class ViewerToolbar(wx.ToolBar):
     def on_chat(self, event):
         """Show/hide chat panel"""
         pane = self.main_window.aui_manager.GetPane("chat")
+        if not pane.IsOk():
+            return
         if pane.IsShown():
             pane.Hide()
         else:
@@ -118,6 +120,8 @@ class ViewerToolbar(wx.ToolBar):
     def on_inventory(self, event):
         """Show/hide inventory panel"""
         pane = self.main_window.aui_manager.GetPane("inventory")
+        if not pane.IsOk():
+            return
         if pane.IsShown():
             pane.Hide()
         else:
@@ -127,6 +131,8 @@ class ViewerToolbar(wx.ToolBar):
     def on_map(self, event):
         """Show/hide mini map panel"""
         pane = self.main_window.aui_manager.GetPane("mini_map")
+        if not pane.IsOk():
+            return
         if pane.IsShown():
             pane.Hide()
         else:
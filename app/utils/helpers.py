@@ -4,6 +4,8 @@ Helper functions and utilities for various tasks across the application.
 
 import os
 import sys
+import asyncio
+import threading
 import uuid
 import hashlib
 import platform
@@ -131,3 +133,24 @@ def create_directory_if_not_exists(directory):
     except Exception as e:
         print(f"Error creating directory {directory}: {e}")
         return False
+
+
+_async_loop = None
+_async_loop_lock = threading.Lock()
+
+def get_async_loop():
+    """
+    Get the shared background asyncio event loop
+    The loop runs on a daemon thread, started on first use
+    """
+    global _async_loop
+    with _async_loop_lock:
+        if _async_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="kv-asyncio",
+                daemon=True
+            ).start()
+            _async_loop = loop
+    return _async_loop